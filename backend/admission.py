@@ -0,0 +1,129 @@
+"""
+AI 탐색 요청 수락 제어
+클라이언트별 토큰 버킷 요청 제한과, 동시 탐색 수 제한 및 대기열이 찰수록 탐색 깊이/시간을 낮추는 정책
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Tuple
+
+
+class TokenBucket:
+    """초당 rate개씩 최대 capacity개까지 채워지는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self, now: Optional[float] = None) -> bool:
+        """토큰 하나 사용 (없으면 False)"""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class RateLimiter:
+    """클라이언트별 토큰 버킷 요청 제한 (가장 오래 사용하지 않은 버킷부터 정리)"""
+
+    def __init__(self, rate: float, capacity: float, max_clients: int = 10000):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_clients = max_clients
+        self.buckets = OrderedDict()
+        self.rejected = 0
+
+    def allow(self, client: str) -> bool:
+        """client의 요청 허용 여부"""
+        bucket = self.buckets.get(client)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.capacity)
+            self.buckets[client] = bucket
+            while len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(client)
+
+        if bucket.take():
+            return True
+        self.rejected += 1
+        return False
+
+
+class AdmissionRejected(Exception):
+    """탐색 대기열이 가득 차서 요청을 거절함"""
+
+
+class SearchAdmission:
+    """동시 탐색 수 제한과 부하에 따른 탐색 강도 조절
+
+    동시 탐색 수가 max_concurrent를 넘는 요청은 대기하며, 자기 앞에 대기 중인 요청이 많을수록
+    탐색 깊이를 1씩, 시간 제한을 1 / (1 + 대기 순번)로 낮춘다. 대기 중인 요청이 max_waiting개면 거절한다.
+    """
+
+    def __init__(self, max_concurrent: int, max_waiting: int, max_depth: int, time_limit: float,
+                 min_depth: int = 2, min_time_limit: float = 0.5):
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.min_depth = min_depth
+        self.min_time_limit = min_time_limit
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.degraded = 0
+        self.rejected = 0
+
+    def search_settings(self) -> Tuple[int, float]:
+        """현재 부하에서 새 요청에 적용할 (최대 깊이, 시간 제한)"""
+        queued = self.active + self.waiting + 1 - self.max_concurrent
+        if queued <= 0:
+            return self.max_depth, self.time_limit
+        depth = max(self.min_depth, self.max_depth - queued)
+        time_limit = max(self.min_time_limit, self.time_limit / (1 + queued))
+        return depth, time_limit
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[Tuple[int, float]]:
+        """탐색 슬롯 확보 후 (최대 깊이, 시간 제한) 제공 (대기열이 가득 차면 AdmissionRejected)"""
+        if self.waiting >= self.max_waiting:
+            self.rejected += 1
+            raise AdmissionRejected()
+
+        settings = self.search_settings()
+        if settings != (self.max_depth, self.time_limit):
+            self.degraded += 1
+
+        self.waiting += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        self.admitted += 1
+        try:
+            yield settings
+        finally:
+            self.active -= 1
+            self.semaphore.release()
+
+    def stats(self) -> dict:
+        """수락 제어 통계"""
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_concurrent": self.max_concurrent,
+            "admitted": self.admitted,
+            "degraded": self.degraded,
+            "rejected": self.rejected
+        }
@@ -3,16 +3,49 @@
 Minimax 알고리즘과 Alpha-Beta 가지치기를 사용한 강력한 AI
 """
 
+import json
 import math
+import os
 import time
+from functools import lru_cache
 from typing import List, Tuple, Optional
 from game_engine import OthelloGame
+from pattern_eval import compute_indices, load_weights, update_indices
+from stability import board_to_bitboards, count_stable, legal_moves, stable_discs
+from search_cache import SearchCache
+
+try:
+    import numpy as np
+    from batch_eval import boards_to_array, evaluate_boards
+except ImportError:  # NumPy가 없으면 기존 평가 함수만 사용
+    np = None
+
+# 튜닝된 평가 함수 가중치 파일 (tuning.py가 생성)
+DEFAULT_EVAL_WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "eval_weights.json")
+
+# 학습된 패턴 가중치 파일 (지정한 경우에만 기존 평가 함수 대신 패턴 테이블 평가 사용)
+PATTERN_WEIGHTS_PATH = os.environ.get("OTHELLO_PATTERN_WEIGHTS") or None
+
+# 안정돌로 승패가 결정되었는지 확인하기 시작하는 돌 개수
+STABILITY_CUTOFF_DISCS = 40
+
+@lru_cache(maxsize=4)
+def load_eval_weights(path: str) -> dict:
+    """평가 함수 가중치 파일(JSON) 읽기 (같은 파일은 프로세스당 한 번만 읽음, 반환값은 수정하지 말 것)"""
+    with open(path) as f:
+        data = json.load(f)
+    # tuning.py 출력 형식: {"weights": {...}, ...}
+    return data.get("weights", data)
 
 class OthelloAI:
-    def __init__(self, max_depth: int = 8, time_limit: float = 5.0):
+    def __init__(self, max_depth: int = 8, time_limit: float = 5.0, pattern_weights: Optional[str] = None,
+                 weights: Optional[dict] = None, weights_file: Optional[str] = None,
+                 search_cache: Optional[SearchCache] = None):
         self.max_depth = max_depth
         self.time_limit = time_limit
         self.start_time = None
+        self.nodes = 0  # 마지막 탐색에서 방문한 노드 수
+        self.timed_out = False  # 마지막 탐색이 시간 제한으로 중단되었는지 여부
         
         # 평가 함수 가중치 (더 정교한 전략)
         self.weights = {
@@ -28,32 +61,32 @@ class OthelloAI:
             'potential_mobility': 8  # 잠재적 이동성
         }
         
-        # 안정돌 판정을 위한 패턴
-        self.stable_patterns = self._init_stable_patterns()
+        # 튜닝된 가중치 파일이 있으면 적용 (weights 인자가 우선)
+        if weights_file is None and os.path.exists(DEFAULT_EVAL_WEIGHTS_PATH):
+            weights_file = DEFAULT_EVAL_WEIGHTS_PATH
+        if weights_file is not None:
+            self.weights.update(load_eval_weights(weights_file))
+        if weights:
+            self.weights.update(weights)
+        
+        # 패턴 테이블 평가 (가중치 파일을 지정하면 기존 평가 함수와 weights 대신 사용)
+        if pattern_weights is None:
+            pattern_weights = PATTERN_WEIGHTS_PATH
+        if pattern_weights is not None:
+            self.pattern_evaluator = load_weights(pattern_weights)
+        else:
+            self.pattern_evaluator = None
+        
+        # 게임 간 공유 탐색 캐시 (지정한 경우에만 사용), 평가 함수 설정별로 결과를 구분
+        self.search_cache = search_cache
+        if search_cache is not None:
+            self.cache_namespace = search_cache.namespace_id(
+                (tuple(sorted(self.weights.items())), pattern_weights))
         
         # 성능 최적화를 위한 캐시
         self.evaluation_cache = {}
         self.move_ordering_cache = {}
     
-    def _init_stable_patterns(self) -> List[List[Tuple[int, int]]]:
-        """안정돌 패턴 초기화"""
-        patterns = []
-        
-        # 모서리에서 시작하는 안정돌 패턴들
-        corners = [(0, 0), (0, 7), (7, 0), (7, 7)]
-        
-        for corner in corners:
-            # 모서리에서 가로/세로로 연속된 돌들
-            for direction in [(0, 1), (1, 0)]:
-                pattern = [corner]
-                for i in range(1, 8):
-                    next_pos = (corner[0] + direction[0] * i, corner[1] + direction[1] * i)
-                    if 0 <= next_pos[0] < 8 and 0 <= next_pos[1] < 8:
-                        pattern.append(next_pos)
-                patterns.append(pattern)
-        
-        return patterns
-    
     def get_best_move(self, game: OthelloGame) -> Optional[Tuple[int, int]]:
         """최적의 수 반환 (적응적 깊이 조절)"""
         valid_moves = game.get_valid_moves()
@@ -62,12 +95,69 @@ class OthelloAI:
         
         # 시간 제한 시작
         self.start_time = time.time()
+        self.nodes = 0
+        self.timed_out = False
         
         # 캐시 초기화 (새로운 게임 상태마다)
         self.evaluation_cache.clear()
         self.move_ordering_cache.clear()
         
-        # 게임 단계별 적응적 깊이 조절
+        depth = self._select_depth(game, valid_moves)
+        
+        # 대칭으로 같은 포지션을 같은 깊이 이상으로 탐색한 결과가 있으면 재사용
+        if self.search_cache is not None:
+            cached = self.search_cache.lookup(self.cache_namespace, game.board, game.current_player, depth)
+            if cached is not None:
+                return cached[0]
+        
+        return self._minimax_with_alpha_beta(game, depth)
+    
+    def analyze(self, game: OthelloGame, depth: Optional[int] = None, top_k: int = 1) -> dict:
+        """포지션 분석 (상위 top_k 수의 점수와 주요 변화 반환)
+        
+        점수는 현재 차례 플레이어 기준이며 클수록 유리하다.
+        truncated는 시간 제한으로 탐색이 중단되었는지 여부다 (일부 수의 점수는 덜 정확함).
+        """
+        valid_moves = game.get_valid_moves()
+        sign = 1 if game.current_player == 2 else -1
+        
+        if game.is_game_over() or not valid_moves:
+            return {
+                "best_move": None,
+                "score": sign * self._evaluate_position(game),
+                "depth": 0,
+                "pv": [],
+                "moves": [],
+                "truncated": False
+            }
+        
+        self.start_time = time.time()
+        self.nodes = 0
+        self.timed_out = False
+        self.evaluation_cache.clear()
+        self.move_ordering_cache.clear()
+        
+        if depth is None:
+            depth = self._select_depth(game, valid_moves)
+        
+        entries = self._search_root(game, depth, max(1, top_k))
+        self._store_result(game, entries[0], depth)
+        moves = [
+            {"move": entry["move"], "score": sign * entry["score"], "pv": entry["pv"]}
+            for entry in entries[:max(1, top_k)]
+        ]
+        
+        return {
+            "best_move": moves[0]["move"],
+            "score": moves[0]["score"],
+            "depth": depth,
+            "pv": moves[0]["pv"],
+            "moves": moves,
+            "truncated": self.timed_out
+        }
+    
+    def _select_depth(self, game: OthelloGame, valid_moves: List[Tuple[int, int]]) -> int:
+        """게임 단계와 유효 수 개수에 따른 탐색 깊이 결정"""
         total_discs = game.get_black_count() + game.get_white_count()
         
         if total_discs < 20:  # 게임 초반
@@ -85,40 +175,76 @@ class OthelloAI:
         elif len(valid_moves) <= 6:
             depth = min(depth + 1, 9)
         
-        return self._minimax_with_alpha_beta(game, depth)
+        # 얕은 max_depth 설정에서도 최소 한 수는 탐색
+        return max(1, depth)
+    
+    def _store_result(self, game: OthelloGame, best: dict, depth: int):
+        """끝까지 탐색한 결과를 공유 캐시에 저장 (점수는 현재 차례 플레이어 기준)"""
+        # 시간 제한으로 중단된 결과는 첫 몇 수만 평가했을 수 있으므로 저장하지 않음
+        if self.search_cache is None or self.timed_out:
+            return
+        sign = 1 if game.current_player == 2 else -1
+        self.search_cache.store(self.cache_namespace, game.board, game.current_player,
+                                best["move"], sign * best["score"], depth)
     
     def _minimax_with_alpha_beta(self, game: OthelloGame, depth: int) -> Optional[Tuple[int, int]]:
         """Alpha-Beta 가지치기를 사용한 Minimax 알고리즘"""
-        best_move = None
-        best_score = -math.inf
+        entries = self._search_root(game, depth, 1)
+        if not entries:
+            return None
+        self._store_result(game, entries[0], depth)
+        return entries[0]["move"]
+    
+    def _search_root(self, game: OthelloGame, depth: int, top_k: int) -> List[dict]:
+        """루트 탐색 (점수순으로 정렬된 수 목록 반환)
         
+        평가 함수는 백돌 기준이므로 흑돌 차례에서는 점수를 최소화한다.
+        상위 top_k 수의 점수만 정확하며, 나머지는 상한값이다.
+        """
         valid_moves = game.get_valid_moves()
         if not valid_moves:
-            return None
+            return []
+        
+        maximizing = game.current_player == 2
+        sign = 1 if maximizing else -1
         
         # 수 정렬 (좋은 수부터 탐색하여 가지치기 효과 증대)
         sorted_moves = self._order_moves(game, valid_moves)
         
+        entries = []
         for move in sorted_moves:
             # 시간 제한 확인 (전역 시간 체크)
-            if self._is_time_up():
+            if self._is_time_up() and entries:
                 break
             
             # 수 시뮬레이션
             new_game = game.copy()
             new_game.make_move(move[0], move[1])
             
+            # top_k 번째 점수보다 나쁜 수는 정확한 점수가 필요 없음
+            bound = -math.inf
+            if len(entries) >= top_k:
+                bound = entries[top_k - 1]["score"] * sign
+            alpha, beta = (bound, math.inf) if maximizing else (-math.inf, -bound)
+            
             # Minimax 점수 계산
-            score = self._minimax(new_game, depth - 1, -math.inf, math.inf, False)
+            child_pv = []
+            score = self._minimax(new_game, depth - 1, alpha, beta,
+                                  new_game.current_player == 2, child_pv)
             
-            if score > best_score:
-                best_score = score
-                best_move = move
+            entries.append({"move": move, "score": score, "pv": [move] + child_pv})
+            entries.sort(key=lambda entry: entry["score"] * sign, reverse=True)
         
-        return best_move
+        return entries
     
-    def _minimax(self, game: OthelloGame, depth: int, alpha: float, beta: float, maximizing: bool) -> float:
-        """Minimax 알고리즘 (Alpha-Beta 가지치기 포함, 성능 최적화)"""
+    def _minimax(self, game: OthelloGame, depth: int, alpha: float, beta: float, maximizing: bool,
+                 pv: Optional[List[Tuple[int, int]]] = None) -> float:
+        """Minimax 알고리즘 (Alpha-Beta 가지치기 포함, 성능 최적화)
+        
+        pv 리스트가 주어지면 이 노드의 주요 변화(principal variation)를 채운다.
+        """
+        self.nodes += 1
+        
         # 시간 제한 확인
         if self._is_time_up():
             return self._evaluate_position(game)
@@ -127,13 +253,27 @@ class OthelloAI:
         if depth == 0 or game.is_game_over():
             return self._evaluate_position(game)
         
+        # 한쪽 안정돌이 과반이면 승패가 이미 결정됨 (하위 트리 전체 가지치기)
+        if game.get_black_count() + game.get_white_count() >= STABILITY_CUTOFF_DISCS:
+            black_stable, white_stable = count_stable(game.board)
+            if white_stable > 32:
+                return 10000
+            if black_stable > 32:
+                return -10000
+        
         valid_moves = game.get_valid_moves()
         
         # 수가 없으면 패스
         if not valid_moves:
             new_game = game.copy()
             new_game.pass_turn()
-            return self._minimax(new_game, depth - 1, alpha, beta, not maximizing)
+            return self._minimax(new_game, depth - 1, alpha, beta, not maximizing, pv)
+        
+        # 마지막 수는 자식 포지션 전체를 한 번에 평가
+        if depth == 1 and self.pattern_evaluator is not None:
+            return self._evaluate_children_patterns(game, valid_moves, maximizing, pv)
+        if depth == 1 and np is not None:
+            return self._evaluate_children(game, valid_moves, maximizing, pv)
         
         # 수 정렬 (가지치기 효과 증대)
         if depth > 2:  # 깊은 탐색에서만 정렬 (성능 최적화)
@@ -148,8 +288,12 @@ class OthelloAI:
                     
                 new_game = game.copy()
                 new_game.make_move(move[0], move[1])
-                eval_score = self._minimax(new_game, depth - 1, alpha, beta, False)
-                max_eval = max(max_eval, eval_score)
+                child_pv = [] if pv is not None else None
+                eval_score = self._minimax(new_game, depth - 1, alpha, beta, False, child_pv)
+                if eval_score > max_eval:
+                    max_eval = eval_score
+                    if pv is not None:
+                        pv[:] = [move] + child_pv
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
                     break  # Beta 가지치기
@@ -163,13 +307,67 @@ class OthelloAI:
                     
                 new_game = game.copy()
                 new_game.make_move(move[0], move[1])
-                eval_score = self._minimax(new_game, depth - 1, alpha, beta, True)
-                min_eval = min(min_eval, eval_score)
+                child_pv = [] if pv is not None else None
+                eval_score = self._minimax(new_game, depth - 1, alpha, beta, True, child_pv)
+                if eval_score < min_eval:
+                    min_eval = eval_score
+                    if pv is not None:
+                        pv[:] = [move] + child_pv
                 beta = min(beta, eval_score)
                 if beta <= alpha:
                     break  # Alpha 가지치기
             return min_eval
     
+    def _evaluate_children(self, game: OthelloGame, moves: List[Tuple[int, int]], maximizing: bool,
+                           pv: Optional[List[Tuple[int, int]]] = None) -> float:
+        """모든 자식 포지션을 NumPy로 일괄 평가하여 최선의 점수 반환"""
+        self.nodes += len(moves)
+        boards = [game.get_board_after_move(row, col) for row, col in moves]
+        scores = evaluate_boards(boards_to_array(boards), self.weights)
+        index = int(np.argmax(scores)) if maximizing else int(np.argmin(scores))
+        if pv is not None:
+            pv[:] = [moves[index]]
+        return float(scores[index])
+    
+    def _evaluate_children_patterns(self, game: OthelloGame, moves: List[Tuple[int, int]], maximizing: bool,
+                                    pv: Optional[List[Tuple[int, int]]] = None) -> float:
+        """부모 패턴 인덱스를 수마다 점진적으로 갱신하여 자식 포지션 평가
+        
+        _evaluate_position과 같이 양쪽 모두 둘 곳이 없는 자식 포지션은 승패 점수로 평가한다.
+        """
+        self.nodes += len(moves)
+        indices = compute_indices(game.board)
+        player = game.current_player
+        black, white = game.get_black_count(), game.get_white_count()
+        black_bits, white_bits = board_to_bitboards(game.board)
+        own_bits, opponent_bits = (white_bits, black_bits) if player == 2 else (black_bits, white_bits)
+        
+        best_score = None
+        best_move = None
+        for move in moves:
+            flips = game.get_flips(move[0], move[1])
+            if player == 2:
+                child_white, child_black = white + len(flips) + 1, black - len(flips)
+            else:
+                child_white, child_black = white - len(flips), black + len(flips) + 1
+            
+            # 자식 포지션 비트보드로 종료 판정 (상대와 자신 모두 둘 곳이 없으면 게임 종료)
+            flip_bits = sum(1 << (row * 8 + col) for row, col in flips)
+            child_own = own_bits | flip_bits | (1 << (move[0] * 8 + move[1]))
+            child_opponent = opponent_bits & ~flip_bits
+            if not legal_moves(child_opponent, child_own) and not legal_moves(child_own, child_opponent):
+                score = float((child_white > child_black) - (child_white < child_black)) * 10000
+            else:
+                score = self.pattern_evaluator.evaluate_indices(update_indices(indices, move, player, flips))
+            
+            if best_score is None or (score > best_score if maximizing else score < best_score):
+                best_score = score
+                best_move = move
+        
+        if pv is not None:
+            pv[:] = [best_move]
+        return best_score
+    
     def _order_moves(self, game: OthelloGame, moves: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
         """수 정렬 (더 정교한 우선순위)"""
         def move_priority(move):
@@ -209,10 +407,12 @@ class OthelloAI:
         return sorted(moves, key=move_priority, reverse=True)
     
     def _is_time_up(self) -> bool:
-        """시간 제한 확인"""
+        """시간 제한 확인 (한 번이라도 초과하면 이번 탐색을 중단된 것으로 기록)"""
         if self.start_time is None:
             return False
-        return time.time() - self.start_time > self.time_limit
+        if time.time() - self.start_time > self.time_limit:
+            self.timed_out = True
+        return self.timed_out
     
     def _is_frontier_position(self, game: OthelloGame, row: int, col: int) -> bool:
         """프론티어 위치인지 확인 (빈 칸과 인접한 위치)"""
@@ -254,20 +454,28 @@ class OthelloAI:
             else:  # 무승부
                 return 0
         
+        if self.pattern_evaluator is not None:
+            return self.pattern_evaluator.evaluate(game.board)
+        
         score = 0
         total_discs = game.get_black_count() + game.get_white_count()
         
+        # 양쪽 안정돌을 비트보드로 한 번에 계산
+        black_stable, white_stable = stable_discs(*board_to_bitboards(game.board))
+        stable = black_stable | white_stable
+        
         # 각 위치별 점수 계산
         for row in range(8):
             for col in range(8):
                 if game.board[row][col] == 2:  # AI 돌
-                    score += self._get_position_value(game, row, col, True)
+                    score += self._get_position_value(game, row, col, True, stable)
                 elif game.board[row][col] == 1:  # 플레이어 돌
-                    score -= self._get_position_value(game, row, col, False)
+                    score -= self._get_position_value(game, row, col, False, stable)
         
         # 이동성 평가
-        ai_moves = len(game.get_valid_moves())
         original_player = game.current_player
+        game.current_player = 2  # AI 차례로 변경
+        ai_moves = len(game.get_valid_moves())
         game.current_player = 1  # 플레이어 차례로 변경
         player_moves = len(game.get_valid_moves())
         game.current_player = original_player  # 원래 플레이어로 복원
@@ -356,8 +564,8 @@ class OthelloAI:
         
         return ai_internal - player_internal
     
-    def _get_position_value(self, game: OthelloGame, row: int, col: int, is_ai: bool) -> float:
-        """특정 위치의 가치 계산"""
+    def _get_position_value(self, game: OthelloGame, row: int, col: int, is_ai: bool, stable: int = 0) -> float:
+        """특정 위치의 가치 계산 (stable: 안정돌 비트보드)"""
         value = 0
         
         # 모서리 점유
@@ -377,28 +585,7 @@ class OthelloAI:
             value += self.weights['edge']
         
         # 안정성 평가
-        if self._is_stable(game, row, col):
+        if stable >> (row * 8 + col) & 1:
             value += self.weights['stability']
         
         return value
-    
-    def _is_stable(self, game: OthelloGame, row: int, col: int) -> bool:
-        """돌의 안정성 판정"""
-        # 모서리는 항상 안정
-        if (row, col) in [(0, 0), (0, 7), (7, 0), (7, 7)]:
-            return True
-        
-        # 모서리에서 연속된 돌들은 안정
-        for pattern in self.stable_patterns:
-            if (row, col) in pattern:
-                # 패턴의 모든 돌이 같은 색인지 확인
-                player = game.board[row][col]
-                is_stable = True
-                for r, c in pattern:
-                    if game.board[r][c] != player:
-                        is_stable = False
-                        break
-                if is_stable:
-                    return True
-        
-        return False
@@ -0,0 +1,200 @@
+"""
+오델로 일괄 분석
+여러 포지션을 프로세스 풀에서 병렬로 분석하고, 대칭으로 같은 포지션은 한 번만 탐색
+"""
+
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Callable, List, Tuple, Optional
+from game_engine import OthelloGame
+from ai_engine import OthelloAI
+from symmetry import canonical_key, key_to_board, inverse_transform_move
+
+
+def game_from_moves(moves: List[Tuple[int, int]]) -> OthelloGame:
+    """초기 포지션에서 수순을 재생하여 게임 생성 (패스는 자동 처리)"""
+    return OthelloGame.from_moves(moves)
+
+
+def create_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """분석 워커 프로세스 풀 생성
+
+    여러 스레드가 도는 서버 프로세스를 fork하면 다른 스레드가 잡고 있던 잠금이 잠긴 채로 워커에
+    복사될 수 있으므로 forkserver(지원하지 않는 플랫폼에서는 spawn)로 워커를 시작한다.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                               mp_context=multiprocessing.get_context(method))
+
+
+def analyze_position_key(key: Tuple[int, ...], depth: Optional[int], time_limit: float, top_k: int) -> dict:
+    """정규화된 포지션 하나 분석 (워커 프로세스에서 실행)"""
+    board, current_player = key_to_board(key)
+    game = OthelloGame.from_position(board, current_player)
+    ai = OthelloAI(time_limit=time_limit)
+    return ai.analyze(game, depth, top_k)
+
+
+def _restore_orientation(result: dict, symmetry: int) -> dict:
+    """정규화 좌표의 분석 결과를 원래 포지션 좌표로 변환"""
+    return {
+        "best_move": inverse_transform_move(result["best_move"], symmetry),
+        "score": result["score"],
+        "depth": result["depth"],
+        "pv": [inverse_transform_move(move, symmetry) for move in result["pv"]],
+        "moves": [
+            {
+                "move": inverse_transform_move(entry["move"], symmetry),
+                "score": entry["score"],
+                "pv": [inverse_transform_move(move, symmetry) for move in entry["pv"]]
+            }
+            for entry in result["moves"]
+        ],
+        "truncated": result["truncated"]
+    }
+
+
+def analyze_games(games: List[OthelloGame], depth: Optional[int] = None, time_limit: float = 5.0,
+                  top_k: int = 1, max_workers: Optional[int] = None,
+                  executor: Optional[Executor] = None) -> List[dict]:
+    """여러 포지션을 병렬 분석하여 입력 순서대로 결과 반환
+
+    대칭(회전/반전)으로 같은 포지션은 한 번만 탐색한다.
+    executor를 주면 그 풀을 사용하고, 없으면 이번 호출에만 쓸 풀을 만든다.
+    """
+    keys = []
+    symmetries = []
+    for game in games:
+        key, symmetry = canonical_key(game.board, game.current_player)
+        keys.append(key)
+        symmetries.append(symmetry)
+
+    unique_keys = list(dict.fromkeys(keys))
+
+    if len(unique_keys) <= 1:
+        # 분석할 포지션이 하나뿐이면 프로세스 풀 생성 비용을 피함
+        results = [analyze_position_key(key, depth, time_limit, top_k) for key in unique_keys]
+    else:
+        pool = executor or create_pool(min(len(unique_keys), max_workers or os.cpu_count() or 1))
+        try:
+            results = list(pool.map(
+                analyze_position_key,
+                unique_keys,
+                [depth] * len(unique_keys),
+                [time_limit] * len(unique_keys),
+                [top_k] * len(unique_keys)
+            ))
+        finally:
+            if pool is not executor:
+                pool.shutdown()
+
+    results_by_key = dict(zip(unique_keys, results))
+    return [
+        _restore_orientation(results_by_key[key], symmetry)
+        for key, symmetry in zip(keys, symmetries)
+    ]
+
+
+def _usable(entry: Tuple[int, dict, float], top_k: int, time_limit: float) -> bool:
+    """캐시 항목 (top_k, 결과, 시간 제한)을 요청에 사용할 수 있는지
+
+    후보 수가 충분해야 하며, 시간 제한으로 중단된 결과는 요청 이상의 시간 제한으로 탐색했어야 한다.
+    """
+    entry_top_k, result, entry_time_limit = entry
+    return entry_top_k >= top_k and (not result["truncated"] or entry_time_limit >= time_limit)
+
+
+class AnalysisCache:
+    """포지션별 분석 결과 LRU 캐시
+
+    대칭으로 같은 포지션은 같은 항목을 공유하며, 같은 포지션에 대한
+    동시 요청은 진행 중인 탐색 하나를 기다린다 (begin -> run/abandon).
+    항목마다 탐색 시간 제한을 기록하며, 시간 제한으로 중단된 결과는 같은 시간 제한 이하의
+    요청에만 사용한다 (부하로 시간 제한이 낮아진 결과를 전체 시간 요청에 주지 않음).
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.inflight = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def begin(self, game: OthelloGame, depth: Optional[int], top_k: int,
+              time_limit: float) -> Tuple[Optional[dict], Optional[Future], bool]:
+        """캐시 확인 후 (캐시된 결과, 진행 중인 탐색, 직접 탐색해야 하는지) 반환
+
+        캐시에 없으면 같은 포지션을 탐색 중인 요청의 Future를 반환하며, 끝나면 그 결과를 restore로
+        변환하여 사용한다 (탐색을 맡은 요청이 포기하면 None으로 끝나며, 다시 begin을 호출).
+        진행 중인 탐색도 없으면 호출자가 탐색을 맡으며, run 또는 abandon으로 반드시 끝내야 한다.
+        """
+        position_key, symmetry = canonical_key(game.board, game.current_player)
+        key = (position_key, depth)
+
+        with self.lock:
+            cached = self.entries.get(key)
+            # 더 많은 후보를 담은 결과는 적은 top_k 요청에도 사용 가능
+            if cached is not None and _usable(cached, top_k, time_limit):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self._slice(_restore_orientation(cached[1], symmetry), top_k), None, False
+            future = self.inflight.get(key)
+            if future is not None and future.top_k >= top_k:
+                self.hits += 1
+                return None, future, False
+            future = Future()
+            future.top_k = top_k
+            self.inflight[key] = future
+            self.misses += 1
+        return None, future, True
+
+    def run(self, game: OthelloGame, depth: Optional[int], top_k: int, time_limit: float, future: Future,
+            compute: Callable[[Tuple[int, ...], Optional[int], float, int], dict]) -> dict:
+        """begin으로 맡은 탐색을 compute(정규화 포지션, 깊이, 시간 제한, top_k)로 실행하여 캐시에 저장하고 결과 반환"""
+        position_key, symmetry = canonical_key(game.board, game.current_player)
+        key = (position_key, depth)
+
+        try:
+            result = compute(position_key, depth, time_limit, top_k)
+        except Exception as e:
+            self._release(key, future)
+            future.set_exception(e)
+            raise
+
+        with self.lock:
+            cached = self.entries.get(key)
+            # 기존 항목이 이 결과를 대신할 수 있으면 유지 (끝까지 탐색한 결과는 중단된 결과를 대체)
+            if cached is None or not _usable(cached, top_k, time_limit) or cached[1]["truncated"] > result["truncated"]:
+                self.entries[key] = (top_k, result, time_limit)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        self._release(key, future)
+        future.set_result(result)
+
+        return _restore_orientation(result, symmetry)
+
+    def restore(self, game: OthelloGame, result: dict, top_k: int) -> dict:
+        """진행 중이던 탐색의 결과(정규화 좌표)를 이 포지션 좌표로 변환"""
+        _, symmetry = canonical_key(game.board, game.current_player)
+        return self._slice(_restore_orientation(result, symmetry), top_k)
+
+    def abandon(self, game: OthelloGame, depth: Optional[int], future: Future):
+        """begin으로 맡은 탐색을 실행하지 않음 (기다리던 요청은 다시 begin을 호출)"""
+        position_key, _ = canonical_key(game.board, game.current_player)
+        self._release((position_key, depth), future)
+        future.set_result(None)
+
+    def _release(self, key: Tuple[Tuple[int, ...], Optional[int]], future: Future):
+        """진행 중 탐색 목록에서 제거"""
+        with self.lock:
+            if self.inflight.get(key) is future:
+                del self.inflight[key]
+
+    def _slice(self, result: dict, top_k: int) -> dict:
+        """상위 top_k 후보만 남김"""
+        return dict(result, moves=result["moves"][:top_k])
@@ -0,0 +1,194 @@
+"""
+오델로 일괄 평가
+N개의 포지션(N x 64 int8 배열)을 NumPy 벡터 연산으로 한 번에 평가
+OthelloAI._evaluate_position과 같은 점수(백돌 기준)를 계산한다
+"""
+
+from typing import List
+import numpy as np
+from stability import HORIZONTAL_LINES, VERTICAL_LINES, DIAGONAL_LINES, ANTI_DIAGONAL_LINES
+
+# 8방향 벡터 (상, 하, 좌, 우, 대각선)
+DIRECTIONS = [
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1)
+]
+
+CORNERS = [(0, 0), (0, 7), (7, 0), (7, 7)]
+CORNER_ADJACENT = [
+    (0, 1), (0, 6), (1, 0), (1, 1), (1, 6), (1, 7),
+    (6, 0), (6, 1), (6, 6), (6, 7), (7, 1), (7, 6)
+]
+
+WIN_SCORE = 10000
+
+# 축별 줄-칸 소속 행렬 (가로, 세로, 대각선, 반대 대각선), 줄 수 x 64
+AXIS_LINES = [
+    np.array([[mask >> i & 1 for i in range(64)] for mask in lines], dtype=np.int32)
+    for lines in (HORIZONTAL_LINES, VERTICAL_LINES, DIAGONAL_LINES, ANTI_DIAGONAL_LINES)
+]
+
+# 축별 가장자리 칸 마스크 (그 축 방향으로 보드 끝에 닿는 칸)
+_BORDER = np.zeros((8, 8), dtype=bool)
+_BORDER[[0, 7], :] = True
+_BORDER[:, [0, 7]] = True
+_COLUMN_EDGES = np.zeros((8, 8), dtype=bool)
+_COLUMN_EDGES[:, [0, 7]] = True
+_ROW_EDGES = np.zeros((8, 8), dtype=bool)
+_ROW_EDGES[[0, 7], :] = True
+AXIS_EDGES = [_COLUMN_EDGES, _ROW_EDGES, _BORDER, _BORDER]
+
+# 축별 이웃 방향
+AXIS_DIRECTIONS = [((0, 1), (0, -1)), ((1, 0), (-1, 0)), ((1, 1), (-1, -1)), ((1, -1), (-1, 1))]
+
+
+def _square_mask(squares: List[tuple]) -> np.ndarray:
+    """칸 목록의 8 x 8 마스크"""
+    mask = np.zeros((8, 8), dtype=bool)
+    for row, col in squares:
+        mask[row, col] = True
+    return mask
+
+
+CORNER_MASK = _square_mask(CORNERS)
+CORNER_ADJACENT_MASK = _square_mask(CORNER_ADJACENT)
+
+# 평가 특징 (OthelloAI.weights의 키와 같은 순서로 가중치 벡터를 만듦)
+FEATURE_NAMES = [
+    'corner', 'corner_adjacent', 'edge', 'stability', 'mobility', 'potential_mobility',
+    'frontier', 'internal', 'parity', 'disc_count'
+]
+
+
+def weight_vector(weights: dict) -> np.ndarray:
+    """가중치 딕셔너리를 특징 순서의 벡터로 변환"""
+    return np.array([weights[name] for name in FEATURE_NAMES], dtype=np.float64)
+
+
+def boards_to_array(boards: List[List[List[int]]]) -> np.ndarray:
+    """2차원 리스트 보드 목록을 N x 64 int8 배열로 변환"""
+    return np.asarray(boards, dtype=np.int8).reshape(-1, 64)
+
+
+def bitboards_to_array(black: np.ndarray, white: np.ndarray) -> np.ndarray:
+    """흑/백 비트보드(uint64, 비트 i = row * 8 + col) 배열을 N x 64 int8 배열로 변환"""
+    shifts = np.arange(64, dtype=np.uint64)
+    black_bits = (np.asarray(black, dtype=np.uint64)[:, None] >> shifts) & np.uint64(1)
+    white_bits = (np.asarray(white, dtype=np.uint64)[:, None] >> shifts) & np.uint64(1)
+    return (black_bits + white_bits * np.uint64(2)).astype(np.int8)
+
+
+def _shift(mask: np.ndarray, dr: int, dc: int) -> np.ndarray:
+    """N x 8 x 8 마스크를 (dr, dc)만큼 이동 (보드 밖은 False)"""
+    shifted = np.zeros_like(mask)
+    src_rows = slice(max(0, -dr), 8 - max(0, dr))
+    dst_rows = slice(max(0, dr), 8 - max(0, -dr))
+    src_cols = slice(max(0, -dc), 8 - max(0, dc))
+    dst_cols = slice(max(0, dc), 8 - max(0, -dc))
+    shifted[:, dst_rows, dst_cols] = mask[:, src_rows, src_cols]
+    return shifted
+
+
+def mobility(own: np.ndarray, opponent: np.ndarray) -> np.ndarray:
+    """own 쪽이 둘 수 있는 칸 마스크 (N x 8 x 8) 계산"""
+    empty = ~(own | opponent)
+    moves = np.zeros_like(own)
+    for dr, dc in DIRECTIONS:
+        # own 돌에서 출발해 연속된 상대 돌을 따라가고, 그 끝의 빈 칸이 착수 가능
+        candidates = _shift(own, dr, dc) & opponent
+        for _ in range(5):
+            candidates |= _shift(candidates, dr, dc) & opponent
+        moves |= _shift(candidates, dr, dc) & empty
+    return moves
+
+
+def frontier(occupied: np.ndarray) -> np.ndarray:
+    """빈 칸과 인접한 돌 마스크 (N x 8 x 8) 계산"""
+    empty = ~occupied
+    near_empty = np.zeros_like(occupied)
+    for dr, dc in DIRECTIONS:
+        near_empty |= _shift(empty, dr, dc)
+    return near_empty & occupied
+
+
+def stable_discs(cells: np.ndarray) -> np.ndarray:
+    """양쪽 안정돌 마스크 (N x 8 x 8) 계산 (stability.stable_discs와 같은 규칙)"""
+    count = cells.shape[0]
+    occupied = (cells != 0).reshape(count, 64).astype(np.int32)
+
+    # 축별 가득 찬 줄 + 가장자리 (줄의 돌 개수가 줄 길이와 같으면 가득 참)
+    axis_conditions = []
+    for lines, edges in zip(AXIS_LINES, AXIS_EDGES):
+        full_lines = (occupied @ lines.T) == lines.sum(axis=1)
+        full = (full_lines.astype(np.int32) @ lines) > 0
+        axis_conditions.append(full.reshape(count, 8, 8) | edges)
+
+    stable = np.zeros(cells.shape, dtype=bool)
+    for player in (1, 2):
+        own = cells == player
+        own_stable = np.zeros_like(own)
+        while True:
+            new_stable = own.copy()
+            for condition, (forward, backward) in zip(axis_conditions, AXIS_DIRECTIONS):
+                new_stable &= condition | _shift(own_stable, *forward) | _shift(own_stable, *backward)
+            if (new_stable == own_stable).all():
+                break
+            own_stable = new_stable
+        stable |= own_stable
+    return stable
+
+
+def feature_matrix(boards: np.ndarray) -> tuple:
+    """N x 64 보드 배열의 평가 특징 (백돌 - 흑돌 차이) 계산
+
+    (N x 특징 수 배열, 게임 종료 여부 (N,), 돌 개수 차이 (N,)) 반환
+    """
+    cells = np.asarray(boards, dtype=np.int8).reshape(-1, 8, 8)
+
+    white = cells == 2
+    black = cells == 1
+    occupied = white | black
+    signed = white.astype(np.float64) - black.astype(np.float64)
+
+    white_count = white.sum(axis=(1, 2))
+    black_count = black.sum(axis=(1, 2))
+    total_discs = white_count + black_count
+    disc_diff = white_count - black_count
+
+    # 이동성 (잠재적 이동성도 같은 값)
+    white_moves = mobility(white, black).sum(axis=(1, 2))
+    black_moves = mobility(black, white).sum(axis=(1, 2))
+    mobility_diff = white_moves - black_moves
+
+    # 프론티어 (적을수록 좋으므로 흑돌 - 백돌)
+    frontier_mask = frontier(occupied)
+    frontier_diff = (frontier_mask & black).sum(axis=(1, 2)) - (frontier_mask & white).sum(axis=(1, 2))
+
+    # 게임 후반: 패리티와 돌 개수
+    late = total_discs > 50
+    parity = np.where((64 - total_discs) % 2 == 0, 1, -1)
+
+    features = np.stack([
+        (signed * CORNER_MASK).sum(axis=(1, 2)),
+        (signed * CORNER_ADJACENT_MASK).sum(axis=(1, 2)),
+        (signed * _BORDER).sum(axis=(1, 2)),
+        (signed * stable_discs(cells)).sum(axis=(1, 2)),
+        mobility_diff,
+        mobility_diff,
+        frontier_diff,
+        (signed * ~frontier_mask)[:, 2:6, 2:6].sum(axis=(1, 2)),
+        np.where(late, parity, 0),
+        np.where(late, disc_diff * 3, 0)
+    ], axis=1).astype(np.float64)
+
+    # 양쪽 모두 둘 곳이 없으면 게임 종료
+    game_over = (white_moves == 0) & (black_moves == 0)
+    return features, game_over, disc_diff
+
+
+def evaluate_boards(boards: np.ndarray, weights: dict) -> np.ndarray:
+    """N x 64 보드 배열을 평가하여 백돌 기준 점수 배열 (N,) 반환"""
+    features, game_over, disc_diff = feature_matrix(boards)
+    score = features @ weight_vector(weights)
+    return np.where(game_over, np.sign(disc_diff) * WIN_SCORE, score)
@@ -27,9 +27,12 @@ class OthelloGame:
         self.winner = None
         self.pass_count = 0  # 연속 패스 횟수
         self.last_move = None  # 마지막 수 위치 (row, col)
+        self.version = 0  # 착수/패스/되돌리기마다 증가 (되돌린 뒤 다시 둬도 같은 값이 되지 않음)
         
         # 게임 히스토리 - 각 수에 대한 상태 저장
         self.history = []
+        # 히스토리 시작 전에 둔 수 (기보로 빠르게 재생한 게임)
+        self.base_moves = []
         self._save_initial_state()
         
         # 8방향 벡터 (상, 하, 좌, 우, 대각선)
@@ -39,6 +42,56 @@ class OthelloGame:
             (1, -1),  (1, 0),  (1, 1)
         ]
     
+    @classmethod
+    def from_position(cls, board: List[List[int]], current_player: int = 1,
+                      mode="human_vs_ai", human_player=1) -> "OthelloGame":
+        """주어진 보드와 차례로부터 게임 생성 (분석용)"""
+        if len(board) != 8 or any(len(row) != 8 for row in board):
+            raise ValueError("Board must be 8x8")
+        if any(cell not in (0, 1, 2) for row in board for cell in row):
+            raise ValueError("Board cells must be 0, 1 or 2")
+        if current_player not in (1, 2):
+            raise ValueError("Player must be 1 or 2")
+        
+        game = cls(mode, human_player)
+        game.board = [list(row) for row in board]
+        game.current_player = current_player
+        
+        # 양쪽 모두 둘 곳이 없으면 종료된 포지션
+        if not game.get_valid_moves():
+            game.current_player = 2 if current_player == 1 else 1
+            opponent_has_moves = len(game.get_valid_moves()) > 0
+            game.current_player = current_player
+            if not opponent_has_moves:
+                game.game_over = True
+                game._determine_winner()
+        
+        game.history = []
+        game._save_initial_state()
+        return game
+    
+    @classmethod
+    def from_moves(cls, moves: List[Tuple[int, int]], mode="human_vs_ai", human_player=1,
+                   player1_name="Player 1", player2_name="Player 2") -> "OthelloGame":
+        """초기 포지션에서 수순을 재생하여 게임 생성 (패스는 자동 처리)
+        
+        수마다 히스토리를 저장하지 않으므로, 생성된 게임은 재생이 끝난 포지션 이전으로 되돌릴 수 없다.
+        """
+        game = cls(mode, human_player, player1_name, player2_name)
+        for index, (row, col) in enumerate(moves):
+            if game.game_over or not game.make_move(row, col, record=False):
+                raise ValueError(f"Invalid move at index {index}: ({row}, {col})")
+        
+        game.base_moves = [tuple(move) for move in moves]
+        game.history = []
+        game._save_initial_state()
+        return game
+    
+    def get_moves(self) -> List[Tuple[int, int]]:
+        """초기 포지션부터 현재까지 둔 수 목록 (패스 제외)"""
+        recorded = [state['move_position'] for state in self.history if state['move_type'] == 'move']
+        return self.base_moves + recorded
+    
     def _save_initial_state(self):
         """초기 게임 상태를 히스토리에 저장"""
         state = {
@@ -106,8 +159,8 @@ class OthelloGame:
                     valid_moves.append((row, col))
         return valid_moves
     
-    def make_move(self, row: int, col: int) -> bool:
-        """착수하고 상대방 돌 뒤집기"""
+    def make_move(self, row: int, col: int, record: bool = True) -> bool:
+        """착수하고 상대방 돌 뒤집기 (record=False면 히스토리에 저장하지 않음)"""
         if not self.is_valid_move(row, col):
             return False
         
@@ -128,13 +181,35 @@ class OthelloGame:
         self.current_player = 2 if self.current_player == 1 else 1
         
         # 게임 종료 조건 확인
-        self._check_game_over()
+        self._check_game_over(record)
         
         # 상태를 히스토리에 저장
-        self._save_state('move', (row, col))
+        if record:
+            self._save_state('move', (row, col))
         
+        self.version += 1
         return True
     
+    def get_flips(self, row: int, col: int) -> List[Tuple[int, int]]:
+        """착수 시 뒤집히는 상대방 돌 위치 목록 반환 (게임 상태는 변경하지 않음)"""
+        flips = []
+        for dr, dc in self.directions:
+            if not self._can_flip_in_direction(row, col, dr, dc):
+                continue
+            r, c = row + dr, col + dc
+            while self.board[r][c] != self.current_player:
+                flips.append((r, c))
+                r, c = r + dr, c + dc
+        return flips
+    
+    def get_board_after_move(self, row: int, col: int) -> List[List[int]]:
+        """착수 후의 보드를 반환 (게임 상태는 변경하지 않음, 유효한 수라고 가정)"""
+        board = [list(r) for r in self.board]
+        board[row][col] = self.current_player
+        for r, c in self.get_flips(row, col):
+            board[r][c] = self.current_player
+        return board
+    
     def _flip_in_direction(self, row: int, col: int, dr: int, dc: int):
         """특정 방향으로 상대방 돌 뒤집기"""
         if not self._can_flip_in_direction(row, col, dr, dc):
@@ -148,17 +223,20 @@ class OthelloGame:
             self.board[r][c] = self.current_player
             r, c = r + dr, c + dc
     
-    def pass_turn(self):
+    def pass_turn(self, record: bool = True):
         """차례 패스"""
         self.pass_count += 1
         self.last_move = None  # 패스 시 마지막 수 위치 초기화
         self.current_player = 2 if self.current_player == 1 else 1
-        self._check_game_over()
+        self._check_game_over(record)
         
         # 상태를 히스토리에 저장
-        self._save_state('pass')
+        if record:
+            self._save_state('pass')
+        
+        self.version += 1
     
-    def _check_game_over(self):
+    def _check_game_over(self, record: bool = True):
         """게임 종료 조건 확인"""
         # 1. 보드가 가득 찬 경우
         if self._is_board_full():
@@ -198,7 +276,7 @@ class OthelloGame:
                 return
             else:
                 # 현재 플레이어만 둘 수 없으면 패스
-                self.pass_turn()
+                self.pass_turn(record)
                 return
     
     def _is_board_full(self) -> bool:
@@ -265,6 +343,7 @@ class OthelloGame:
             "can_pass": len(valid_moves) == 0 and not self.game_over,
             "can_undo": self.can_undo(),
             "history_length": self.get_history_length(),
+            "version": self.get_version(),
             "mode": self.mode,
             "player1_name": self.player1_name,
             "player2_name": self.player2_name,
@@ -297,12 +376,17 @@ class OthelloGame:
         self.pass_count = previous_state['pass_count']
         self.last_move = previous_state['last_move']
         
+        self.version += 1
         return True
     
     def get_history_length(self) -> int:
         """히스토리 길이 반환"""
         return len(self.history)
     
+    def get_version(self) -> int:
+        """게임 상태 버전 (상태가 바뀔 때마다 증가)"""
+        return self.version
+    
     def copy(self):
         """게임 상태 복사 (AI에서 사용)"""
         new_game = OthelloGame(self.mode, self.human_player, self.player1_name, self.player2_name)
@@ -312,5 +396,7 @@ class OthelloGame:
         new_game.winner = self.winner
         new_game.pass_count = self.pass_count
         new_game.last_move = self.last_move
+        new_game.version = self.version
         new_game.history = copy.deepcopy(self.history)
+        new_game.base_moves = list(self.base_moves)
         return new_game
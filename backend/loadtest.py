@@ -0,0 +1,203 @@
+"""
+오델로 API 부하 테스트
+여러 AI 대전 게임을 만들어 끝날 때까지 착수를 반복하며 요청 지연 시간(p50/p95/p99)과 초당 처리 수를 측정
+batch 모드는 라운드마다 모든 게임의 착수를 /api/games/moves 한 번으로, single 모드는 게임별
+/move + /ai-move 요청으로 보낸다. 서버 탐색 대기열이 가득 차 AI가 응수하지 못한 게임은
+다음 라운드에 AI 응수만 다시 요청한다 (결과의 ai_busy).
+
+서버는 요청 제한을 끄고 실행해야 한다:
+    OTHELLO_RATE_LIMITS=0 uvicorn main:app
+
+사용 예:
+    python loadtest.py --games 200 --mode batch
+    python loadtest.py --games 50 --mode single --concurrency 16
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+HUMAN_PLAYER = 1
+
+
+def request_json(base_url: str, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, dict]:
+    """JSON 요청을 보내고 (상태 코드, 응답 본문) 반환"""
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(base_url + path, data=data, method=method,
+                                 headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, {"detail": e.read().decode(errors="replace")}
+
+
+def percentile(values: List[float], p: float) -> float:
+    """정렬된 값 목록의 p 백분위수 (최근접 순위)"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))
+    return values[index]
+
+
+class LoadTest:
+    """게임 생성, 착수 반복, 지연 시간 기록"""
+
+    def __init__(self, base_url: str, concurrency: int, seed: int):
+        self.base_url = base_url.rstrip("/")
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+        self.random = random.Random(seed)
+        self.latencies = []
+        self.moves = 0
+        self.errors = 0
+        self.ai_busy = 0
+        self.lock = threading.Lock()
+
+    def count(self, moves: int = 0, errors: int = 0, ai_busy: int = 0):
+        """착수/오류/AI 대기열 초과 수 누적 (여러 스레드에서 호출)"""
+        with self.lock:
+            self.moves += moves
+            self.errors += errors
+            self.ai_busy += ai_busy
+
+    def timed(self, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, dict]:
+        """요청 지연 시간을 기록하며 요청 (503은 AI 대기열 초과, 그 외 실패는 오류로 집계)"""
+        start_time = time.perf_counter()
+        status, payload = request_json(self.base_url, method, path, body)
+        self.latencies.append(time.perf_counter() - start_time)
+        if status == 503:
+            self.count(ai_busy=1)
+        elif status != 200:
+            self.count(errors=1)
+        return status, payload
+
+    @staticmethod
+    def update(game: dict, state: dict):
+        """응답의 게임 상태 반영"""
+        game["current_player"] = state["current_player"]
+        game["valid_moves"] = state["valid_moves"]
+        game["game_over"] = state["game_over"]
+
+    def create_games(self, count: int) -> List[dict]:
+        """사람(흑) 대 AI(백) 게임 생성, 게임별 {game_id, current_player, valid_moves, game_over} 목록 반환"""
+        def create(_):
+            status, created = request_json(self.base_url, "POST", "/api/game/new",
+                                           {"mode": "human_vs_ai", "human_color": HUMAN_PLAYER})
+            if status != 200:
+                raise RuntimeError(f"Failed to create game: {status} {created}")
+            game = {"game_id": created["game_id"]}
+            self.update(game, created["state"])
+            return game
+        return list(self.executor.map(create, range(count)))
+
+    def pick_move(self, game: dict) -> Optional[List[int]]:
+        """사람 차례면 무작위 합법 수 (AI 차례면 None, 이 경우 AI 응수만 요청)"""
+        if game["current_player"] != HUMAN_PLAYER or not game["valid_moves"]:
+            return None
+        return self.random.choice(game["valid_moves"])
+
+    def run_batch_round(self, active: List[dict], batch_size: int):
+        """모든 진행 중 게임의 착수를 batch_size개씩 묶어 일괄 요청"""
+        items = []
+        for game in active:
+            move = self.pick_move(game)
+            item = {"game_id": game["game_id"], "ai_reply": True}
+            if move is not None:
+                item["row"], item["col"] = move
+            items.append(item)
+
+        chunks = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+        by_id = {game["game_id"]: game for game in active}
+        for chunk, (status, payload) in zip(chunks, self.executor.map(
+                lambda chunk: self.timed("POST", "/api/games/moves", {"moves": chunk}), chunks)):
+            if status != 200:
+                continue
+            for item, result in zip(chunk, payload["results"]):
+                game = by_id[result["game_id"]]
+                if not result["ok"]:
+                    self.count(errors=1)
+                    game["game_over"] = True  # 착수가 거부된 게임은 더 두지 않음
+                    continue
+                ai_error = result["ai_error"]
+                self.count(moves=("row" in item) + (result["ai_move"] is not None),
+                           ai_busy=int(ai_error is not None and ai_error["status"] == 503),
+                           errors=int(ai_error is not None and ai_error["status"] != 503))
+                self.update(game, result)
+
+    def run_single_round(self, active: List[dict]):
+        """게임별로 착수 후 AI 착수 요청"""
+        def play(game: dict):
+            move = self.pick_move(game)
+            if move is not None:
+                status, state = self.timed("POST", f"/api/game/{game['game_id']}/move",
+                                           {"row": move[0], "col": move[1]})
+                if status != 200:
+                    game["game_over"] = True
+                    return
+                self.count(moves=1)
+                self.update(game, state)
+                if game["game_over"] or game["current_player"] == HUMAN_PLAYER:
+                    return  # AI가 패스된 경우
+            status, state = self.timed("POST", f"/api/game/{game['game_id']}/ai-move")
+            if status == 503:
+                return  # 다음 라운드에 AI 응수만 다시 요청
+            if status != 200:
+                game["game_over"] = True
+                return
+            self.count(moves=1)
+            self.update(game, state)
+        list(self.executor.map(play, active))
+
+    def run(self, games: int, rounds: int, mode: str, batch_size: int) -> dict:
+        """부하 테스트 실행 후 결과 요약 반환"""
+        state = self.create_games(games)
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            active = [game for game in state if not game["game_over"]]
+            if not active:
+                break
+            if mode == "batch":
+                self.run_batch_round(active, batch_size)
+            else:
+                self.run_single_round(active)
+        elapsed = time.perf_counter() - start_time
+
+        latencies = sorted(self.latencies)
+        return {
+            "mode": mode,
+            "games": games,
+            "requests": len(latencies),
+            "moves": self.moves,
+            "errors": self.errors,
+            "ai_busy": self.ai_busy,
+            "seconds": elapsed,
+            "moves_per_second": self.moves / elapsed if elapsed else 0.0,
+            "latency_ms": {
+                "p50": percentile(latencies, 50) * 1000,
+                "p95": percentile(latencies, 95) * 1000,
+                "p99": percentile(latencies, 99) * 1000,
+                "max": (latencies[-1] if latencies else 0.0) * 1000
+            }
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오델로 API 부하 테스트")
+    parser.add_argument("--url", default="http://localhost:8000", help="서버 주소")
+    parser.add_argument("--games", type=int, default=100, help="동시에 진행할 게임 수")
+    parser.add_argument("--rounds", type=int, default=40, help="최대 라운드 수 (라운드당 게임별 한 수씩)")
+    parser.add_argument("--mode", choices=["batch", "single"], default="batch")
+    parser.add_argument("--batch-size", type=int, default=32,
+                        help="일괄 요청 하나에 담을 착수 수 (서버 동시 탐색 + 대기열 수 이하 권장)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    test = LoadTest(args.url, args.concurrency, args.seed)
+    print(json.dumps(test.run(args.games, args.rounds, args.mode, args.batch_size), indent=2))
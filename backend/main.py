@@ -1,17 +1,58 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from enum import Enum
+import asyncio
+import base64
+import binascii
+import os
+import time
 import uuid
 from game_engine import OthelloGame
 from ai_engine import OthelloAI
+from analysis import AnalysisCache, analyze_games, create_pool, game_from_moves, analyze_position_key
+from transcript import bytes_to_moves, moves_to_bytes, moves_to_text, text_to_moves
+from admission import AdmissionRejected, RateLimiter, SearchAdmission
+from startup import EngineStartup
+from search_cache import shared_search_cache
 
 class GameMode(str, Enum):
     HUMAN_VS_HUMAN = "human_vs_human"
     HUMAN_VS_AI = "human_vs_ai"
 
-app = FastAPI(title="Othello Game API", version="1.0.0")
+# 시작 단계: 테이블 로드 후 예열 탐색 (OTHELLO_WARMUP_DEPTH=0이면 예열 생략)
+WARMUP_DEPTH = int(os.environ.get("OTHELLO_WARMUP_DEPTH", "4"))
+WARMUP_TIME_LIMIT = 2.0
+engine_startup = EngineStartup()
+
+# 일괄 분석 워커 프로세스 풀 (서버 수명 동안 재사용, lifespan에서 생성/종료)
+analysis_pool: Optional[ProcessPoolExecutor] = None
+
+async def _run_startup():
+    """시작 단계 실행 (실패해도 서버는 계속 동작하며 /api/ready가 오류를 알림)"""
+    try:
+        await run_in_threadpool(engine_startup.run, WARMUP_DEPTH, WARMUP_TIME_LIMIT)
+    except Exception as e:
+        print(f"Engine startup failed: {e}")
+        return
+    print(f"Engine ready in {engine_startup.stats()['startup_seconds']:.2f} seconds")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """시작 단계를 백그라운드에서 실행 (끝날 때까지 /api/ready는 503), 일괄 분석 풀 생성/종료"""
+    global analysis_pool
+    analysis_pool = create_pool()
+    startup_task = asyncio.create_task(_run_startup())
+    yield
+    await startup_task
+    analysis_pool.shutdown(cancel_futures=True)
+    analysis_pool = None
+
+app = FastAPI(title="Othello Game API", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -26,6 +67,38 @@ app.add_middleware(
 games = {}
 ai_engine = OthelloAI()
 
+# 일괄 분석 제한
+MAX_BATCH_POSITIONS = 1000
+MAX_ANALYSIS_DEPTH = 12
+MAX_ANALYSIS_TOP_K = 10
+MIN_ANALYSIS_TIME_LIMIT = 0.1
+MAX_ANALYSIS_TIME_LIMIT = 5.0
+MAX_BATCH_SEARCH_SECONDS = 300  # 요청당 포지션 수 x 포지션당 탐색 시간 상한
+
+# AI 탐색 수락 제어: 동시 탐색 수 제한, 대기열이 찰수록 탐색 깊이/시간을 낮춤
+MAX_CONCURRENT_SEARCHES = 4
+MAX_WAITING_SEARCHES = 32
+search_admission = SearchAdmission(
+    MAX_CONCURRENT_SEARCHES, MAX_WAITING_SEARCHES, ai_engine.max_depth, ai_engine.time_limit
+)
+
+# 클라이언트별 요청 제한 (초당 토큰, 최대 연속 요청 수)
+# 부하 테스트처럼 한 호스트에서 많은 게임을 만들 때는 OTHELLO_RATE_LIMITS=0으로 끔
+RATE_LIMITS_ENABLED = os.environ.get("OTHELLO_RATE_LIMITS", "1") != "0"
+ai_move_limiter = RateLimiter(rate=1.0, capacity=5)
+analysis_limiter = RateLimiter(rate=1.0, capacity=5)  # 캐시에 없는 힌트 분석에만 적용
+new_game_limiter = RateLimiter(rate=0.2, capacity=10)
+
+# 여러 게임 일괄 착수 제한
+MAX_BATCH_MOVES = 500
+
+# 일괄 분석은 프로세스 풀 전체를 쓰므로 한 번에 하나만 실행 (대기 중인 요청이 있으면 포지션당 시간을 낮춤)
+batch_analysis_admission = SearchAdmission(1, 2, MAX_ANALYSIS_DEPTH, MAX_ANALYSIS_TIME_LIMIT)
+batch_analysis_limiter = RateLimiter(rate=0.1, capacity=3)
+
+# 힌트/분석 결과 캐시 (포지션 단위로 여러 게임과 관전자가 공유)
+analysis_cache = AnalysisCache()
+
 class MoveRequest(BaseModel):
     row: int
     col: int
@@ -37,6 +110,38 @@ class NewGameRequest(BaseModel):
     player1_name: Optional[str] = "Player 1"  # 2인용 모드에서만 사용
     player2_name: Optional[str] = "Player 2"  # 2인용 모드에서만 사용
 
+class ImportGameRequest(NewGameRequest):
+    transcript: Optional[str] = None  # 문자 기보 ("f5d6c3...")
+    packed: Optional[str] = None  # 이진 기보 (수당 1바이트, base64 인코딩)
+
+class AnalysisPosition(BaseModel):
+    board: Optional[List[List[int]]] = None  # 보드와 차례로 지정하거나
+    current_player: Optional[int] = 1
+    moves: Optional[List[Tuple[int, int]]] = None  # 초기 포지션부터의 수순으로 지정
+
+class BatchAnalysisRequest(BaseModel):
+    positions: List[AnalysisPosition]
+    depth: Optional[int] = None  # 미지정 시 게임 단계별 적응적 깊이
+    time_limit: Optional[float] = MAX_ANALYSIS_TIME_LIMIT  # 포지션당 탐색 시간 (초)
+
+def _client_key(request: Request) -> str:
+    """요청 제한에 사용할 클라이언트 식별자"""
+    return request.client.host if request.client else "unknown"
+
+def _allow(limiter: RateLimiter, request: Request) -> bool:
+    """요청 제한 확인"""
+    return not RATE_LIMITS_ENABLED or limiter.allow(_client_key(request))
+
+class BatchMoveItem(BaseModel):
+    game_id: str
+    row: Optional[int] = None  # row/col이 없으면 착수 없이 AI 응수만 요청
+    col: Optional[int] = None
+    player: Optional[int] = None  # 2인용 모드에서 현재 플레이어 검증용
+    ai_reply: bool = False  # AI 모드에서 착수 후 AI가 이어서 둘지
+
+class BatchMoveRequest(BaseModel):
+    moves: List[BatchMoveItem]
+
 class GameState(BaseModel):
     board: List[List[int]]
     current_player: int
@@ -52,33 +157,84 @@ class GameState(BaseModel):
     last_action: Optional[str] = None
     last_move: Optional[Tuple[int, int]] = None
 
+def _game_settings(request: NewGameRequest) -> dict:
+    """모드별 게임 생성 인자"""
+    if request.mode == GameMode.HUMAN_VS_AI:
+        # AI 모드: 색깔 선택이 필요
+        human_color = request.human_color or 1  # 기본값: 흑돌
+        return {
+            "mode": "human_vs_ai",
+            "human_player": human_color,
+            "player1_name": "Player",
+            "player2_name": "AI"
+        }
+    # 2인용 모드
+    return {
+        "mode": "human_vs_human",
+        "human_player": 1,  # 2인용 모드에서는 사용되지 않음
+        "player1_name": request.player1_name or "Player 1",
+        "player2_name": request.player2_name or "Player 2"
+    }
+
 @app.post("/api/game/new")
-async def new_game(request: NewGameRequest):
+async def new_game(request: NewGameRequest, http_request: Request):
     """새 게임 시작"""
+    if not _allow(new_game_limiter, http_request):
+        raise HTTPException(status_code=429, detail="Too many new games")
+    
     game_id = str(uuid.uuid4())
     
     # 모드별 게임 생성
-    if request.mode == GameMode.HUMAN_VS_AI:
-        # AI 모드: 색깔 선택이 필요
-        human_color = request.human_color or 1  # 기본값: 흑돌
-        game = OthelloGame(
-            mode="human_vs_ai",
-            human_player=human_color,
-            player1_name="Player",
-            player2_name="AI"
-        )
-    else:
-        # 2인용 모드
-        game = OthelloGame(
-            mode="human_vs_human",
-            human_player=1,  # 2인용 모드에서는 사용되지 않음
-            player1_name=request.player1_name or "Player 1",
-            player2_name=request.player2_name or "Player 2"
-        )
+    game = OthelloGame(**_game_settings(request))
     
     games[game_id] = game
     return {"game_id": game_id, "state": game.get_state()}
 
+@app.post("/api/game/import")
+async def import_game(request: ImportGameRequest, http_request: Request):
+    """기보로부터 게임 생성 (기보의 마지막 포지션에서 이어서 진행)"""
+    if not _allow(new_game_limiter, http_request):
+        raise HTTPException(status_code=429, detail="Too many new games")
+    
+    try:
+        if request.transcript is not None:
+            moves = text_to_moves(request.transcript)
+        elif request.packed is not None:
+            moves = bytes_to_moves(base64.b64decode(request.packed, validate=True))
+        else:
+            raise ValueError("Either transcript or packed is required")
+        game = OthelloGame.from_moves(moves, **_game_settings(request))
+    except (ValueError, binascii.Error) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    game_id = str(uuid.uuid4())
+    games[game_id] = game
+    return {"game_id": game_id, "state": game.get_state()}
+
+@app.get("/api/game/{game_id}/transcript")
+async def export_game(game_id: str, format: str = "text"):
+    """게임 기보 내보내기 (format: text 또는 binary)"""
+    if game_id not in games:
+        raise HTTPException(status_code=404, detail="Game not found")
+    
+    game = games[game_id]
+    moves = game.get_moves()
+    
+    if format == "binary":
+        return Response(content=moves_to_bytes(moves), media_type="application/octet-stream")
+    if format != "text":
+        raise HTTPException(status_code=400, detail="Format must be text or binary")
+    
+    return {
+        "transcript": moves_to_text(moves),
+        "packed": base64.b64encode(moves_to_bytes(moves)).decode("ascii"),
+        "move_count": len(moves),
+        "game_over": game.is_game_over(),
+        "winner": game.winner,
+        "black_count": game.get_black_count(),
+        "white_count": game.get_white_count()
+    }
+
 @app.get("/api/game/{game_id}/state")
 async def get_game_state(game_id: str):
     """게임 상태 조회"""
@@ -95,20 +251,50 @@ async def make_move(game_id: str, move: MoveRequest):
         raise HTTPException(status_code=404, detail="Game not found")
     
     game = games[game_id]
-    
+    _apply_player_move(game, move.row, move.col, move.player)
+    return game.get_state()
+
+def _apply_player_move(game: OthelloGame, row: int, col: int, player: Optional[int]):
+    """플레이어 착수 검증 후 적용"""
     # 2인용 모드에서 플레이어 검증
-    if game.mode == "human_vs_human" and move.player is not None:
-        if move.player != game.current_player:
+    if game.mode == "human_vs_human" and player is not None:
+        if player != game.current_player:
             raise HTTPException(status_code=400, detail="Not your turn")
     
-    if not game.is_valid_move(move.row, move.col):
+    if not game.is_valid_move(row, col):
         raise HTTPException(status_code=400, detail="Invalid move")
     
-    game.make_move(move.row, move.col)
-    return game.get_state()
+    game.make_move(row, col)
+
+async def _play_ai_move(game: OthelloGame) -> Optional[Tuple[int, int]]:
+    """수락 제어를 거쳐 AI 착수, 둔 수 반환 (패스면 None)"""
+    version = game.get_version()
+    try:
+        async with search_admission.slot() as (depth, time_limit):
+            # 탐색은 스레드에서 게임 복사본으로 수행 (이벤트 루프와 원본 게임을 막지 않음)
+            start_time = time.time()
+            ai = OthelloAI(max_depth=depth, time_limit=time_limit, search_cache=shared_search_cache)
+            best_move = await run_in_threadpool(ai.get_best_move, game.copy())
+            end_time = time.time()
+    except AdmissionRejected:
+        raise HTTPException(status_code=503, detail="AI is busy, try again later")
+    
+    print(f"AI thinking time: {end_time - start_time:.2f} seconds (depth {depth}, limit {time_limit:.1f}s)")
+    
+    # 탐색 중 다른 요청으로 게임이 바뀌었으면 (되돌린 뒤 다시 둔 경우 포함) 결과를 버림
+    if game.get_version() != version:
+        raise HTTPException(status_code=409, detail="Game changed during AI move")
+    
+    if best_move:
+        if not game.make_move(best_move[0], best_move[1]):
+            raise HTTPException(status_code=409, detail="AI move is no longer valid")
+    else:
+        # AI가 둘 수 있는 수가 없으면 패스
+        game.pass_turn()
+    return best_move
 
 @app.post("/api/game/{game_id}/ai-move")
-async def ai_move(game_id: str):
+async def ai_move(game_id: str, request: Request):
     """AI 착수 (AI 모드에서만 사용)"""
     if game_id not in games:
         raise HTTPException(status_code=404, detail="Game not found")
@@ -124,21 +310,169 @@ async def ai_move(game_id: str):
     
     # AI가 현재 플레이어인 경우에만 착수
     if game.current_player == game.ai_player:
-        import time
-        start_time = time.time()
-        best_move = ai_engine.get_best_move(game)
-        end_time = time.time()
-        
-        print(f"AI thinking time: {end_time - start_time:.2f} seconds")
-        
-        if best_move:
-            game.make_move(best_move[0], best_move[1])
-        else:
-            # AI가 둘 수 있는 수가 없으면 패스
-            game.pass_turn()
+        if not _allow(ai_move_limiter, request):
+            raise HTTPException(status_code=429, detail="Too many AI move requests")
+        await _play_ai_move(game)
     
     return game.get_state()
 
+@app.post("/api/games/moves")
+async def batch_moves(request: BatchMoveRequest, http_request: Request):
+    """여러 게임 일괄 착수 (선택적으로 AI 응수 포함), 게임별 간단한 결과 반환
+
+    같은 게임의 항목은 요청 순서대로, 서로 다른 게임은 동시에 처리한다.
+    AI 응수 항목은 /ai-move와 같이 항목마다 요청 제한 토큰을 하나씩 사용하며,
+    토큰이 없는 항목은 착수하지 않고 429로 표시한다.
+    """
+    if len(request.moves) > MAX_BATCH_MOVES:
+        raise HTTPException(status_code=400, detail=f"Too many moves (max {MAX_BATCH_MOVES})")
+    
+    results = [None] * len(request.moves)
+    by_game = {}
+    for index, item in enumerate(request.moves):
+        if item.ai_reply and not _allow(ai_move_limiter, http_request):
+            results[index] = {"game_id": item.game_id, "ok": False, "status": 429,
+                              "error": "Too many AI move requests"}
+            continue
+        by_game.setdefault(item.game_id, []).append(index)
+    
+    async def run_game(indices: List[int]):
+        for index in indices:
+            results[index] = await _batch_move_item(request.moves[index])
+    
+    await asyncio.gather(*(run_game(indices) for indices in by_game.values()))
+    return {"results": results}
+
+async def _batch_move_item(item: BatchMoveItem) -> dict:
+    """일괄 착수 항목 하나 처리 (오류는 결과에 기록)
+
+    플레이어 착수가 실패하면 ok: False로 게임은 그대로 둔다. 착수 후 AI 응수만 실패하면
+    (대기열 초과 등) ok: True와 착수 후 상태를 반환하고 실패 내용은 ai_error에 담는다.
+    """
+    try:
+        if item.game_id not in games:
+            raise HTTPException(status_code=404, detail="Game not found")
+        game = games[item.game_id]
+        
+        if item.row is not None and item.col is not None:
+            _apply_player_move(game, item.row, item.col, item.player)
+    except HTTPException as e:
+        return {"game_id": item.game_id, "ok": False, "status": e.status_code, "error": e.detail}
+    
+    ai_move = None
+    ai_error = None
+    if (item.ai_reply and game.mode == "human_vs_ai" and not game.is_game_over()
+            and game.current_player == game.ai_player):
+        try:
+            ai_move = await _play_ai_move(game)
+        except HTTPException as e:
+            ai_error = {"status": e.status_code, "error": e.detail}
+    
+    return {
+        "game_id": item.game_id,
+        "ok": True,
+        "ai_move": ai_move,
+        "ai_error": ai_error,
+        "version": game.get_version(),
+        "current_player": game.current_player,
+        "valid_moves": game.get_valid_moves(),
+        "game_over": game.is_game_over(),
+        "winner": game.winner,
+        "black_count": game.get_black_count(),
+        "white_count": game.get_white_count()
+    }
+
+@app.get("/api/game/{game_id}/analysis")
+async def get_analysis(game_id: str, request: Request, top_k: int = 3, depth: Optional[int] = None):
+    """현재 포지션의 상위 후보 수 분석 (모든 모드에서 사용 가능, 착수하지 않음)
+    
+    캐시에 없으면 AI 착수와 같은 수락 제어를 거쳐 탐색하며, 같은 포지션을 탐색 중인 요청이 있으면 그 결과를 기다린다.
+    """
+    if game_id not in games:
+        raise HTTPException(status_code=404, detail="Game not found")
+    if not 1 <= top_k <= MAX_ANALYSIS_TOP_K:
+        raise HTTPException(status_code=400, detail=f"top_k must be between 1 and {MAX_ANALYSIS_TOP_K}")
+    if depth is not None and not 1 <= depth <= MAX_ANALYSIS_DEPTH:
+        raise HTTPException(status_code=400, detail=f"Depth must be between 1 and {MAX_ANALYSIS_DEPTH}")
+    
+    game = games[game_id]
+    version = game.get_version()
+    # 탐색을 기다리는 동안 게임이 바뀌어도 요청 시점의 포지션을 분석
+    position = game.copy()
+    
+    while True:
+        # 부하로 낮아지지 않은 전체 탐색 시간보다 짧게 탐색하다 중단된 결과는 캐시에서 쓰지 않음
+        result, pending, owner = analysis_cache.begin(position, depth, top_k, search_admission.time_limit)
+        if result is not None:
+            cached = True
+            break
+        if not owner:
+            # 같은 포지션을 탐색 중인 요청이 있으면 탐색 슬롯을 잡지 않고 그 결과를 기다림
+            # (shield: 이 요청이 취소되어도 다른 요청의 탐색은 취소하지 않음)
+            result = await asyncio.shield(asyncio.wrap_future(pending))
+            if result is None:
+                continue  # 탐색을 맡은 요청이 포기함
+            result = analysis_cache.restore(position, result, top_k)
+            cached = True
+            break
+        # 탐색을 직접 맡은 요청만 요청 제한과 수락 제어를 거침
+        try:
+            if not _allow(analysis_limiter, request):
+                raise HTTPException(status_code=429, detail="Too many analysis requests")
+            async with search_admission.slot() as (_, time_limit):
+                result = await run_in_threadpool(
+                    analysis_cache.run, position, depth, top_k, time_limit, pending, analyze_position_key
+                )
+        except AdmissionRejected:
+            raise HTTPException(status_code=503, detail="AI is busy, try again later")
+        finally:
+            # 탐색을 시작하지 못했으면 (요청 제한, 대기열 초과, 연결 끊김) 기다리던 요청이 대신 맡음
+            if not pending.done():
+                analysis_cache.abandon(position, depth, pending)
+        cached = False
+        break
+    
+    return {
+        "version": version,
+        "current_player": position.current_player,
+        "game_over": position.is_game_over(),
+        "depth": result["depth"],
+        "moves": result["moves"],
+        "truncated": result["truncated"],
+        "cached": cached
+    }
+
+@app.get("/api/ready")
+async def get_ready():
+    """준비 상태 (시작 단계가 끝나기 전이나 실패한 경우 503)"""
+    if engine_startup.error is not None:
+        raise HTTPException(status_code=503, detail=f"Engine startup failed: {engine_startup.error}")
+    if not engine_startup.ready:
+        raise HTTPException(status_code=503, detail="Engine is starting")
+    return engine_startup.stats()
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """서버 상태 지표"""
+    return {
+        "games": len(games),
+        "startup": engine_startup.stats(),
+        "ai_search": search_admission.stats(),
+        "rate_limit_rejected": {
+            "ai_move": ai_move_limiter.rejected,
+            "analysis": analysis_limiter.rejected,
+            "new_game": new_game_limiter.rejected,
+            "batch_analysis": batch_analysis_limiter.rejected
+        },
+        "batch_analysis": batch_analysis_admission.stats(),
+        "analysis_cache": {
+            "entries": len(analysis_cache.entries),
+            "hits": analysis_cache.hits,
+            "misses": analysis_cache.misses
+        },
+        "search_cache": shared_search_cache.stats()
+    }
+
 @app.get("/api/game/{game_id}/valid-moves")
 async def get_valid_moves(game_id: str):
     """유효한 수 조회"""
@@ -213,6 +547,63 @@ async def undo_move(game_id: str):
     
     return game.get_state()
 
+@app.post("/api/analysis/batch")
+async def analyze_batch(request: BatchAnalysisRequest, http_request: Request):
+    """여러 포지션 일괄 분석 (최선의 수, 점수, 주요 변화)"""
+    if not _allow(batch_analysis_limiter, http_request):
+        raise HTTPException(status_code=429, detail="Too many batch analysis requests")
+    if not request.positions:
+        raise HTTPException(status_code=400, detail="No positions to analyze")
+    if len(request.positions) > MAX_BATCH_POSITIONS:
+        raise HTTPException(status_code=400, detail=f"Too many positions (max {MAX_BATCH_POSITIONS})")
+    if request.depth is not None and not 1 <= request.depth <= MAX_ANALYSIS_DEPTH:
+        raise HTTPException(status_code=400, detail=f"Depth must be between 1 and {MAX_ANALYSIS_DEPTH}")
+    time_limit = request.time_limit if request.time_limit is not None else MAX_ANALYSIS_TIME_LIMIT
+    if not MIN_ANALYSIS_TIME_LIMIT <= time_limit <= MAX_ANALYSIS_TIME_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Time limit must be between {MIN_ANALYSIS_TIME_LIMIT} and {MAX_ANALYSIS_TIME_LIMIT} seconds"
+        )
+    if len(request.positions) * time_limit > MAX_BATCH_SEARCH_SECONDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Positions x time limit must not exceed {MAX_BATCH_SEARCH_SECONDS} seconds"
+        )
+    
+    positions = []
+    for index, position in enumerate(request.positions):
+        try:
+            if position.moves is not None:
+                positions.append(game_from_moves(position.moves))
+            elif position.board is not None:
+                positions.append(OthelloGame.from_position(position.board, position.current_player or 1))
+            else:
+                raise ValueError("Either board or moves is required")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Position {index}: {e}")
+    
+    try:
+        async with batch_analysis_admission.slot() as (max_depth, max_time_limit):
+            depth = None if request.depth is None else min(request.depth, max_depth)
+            results = await run_in_threadpool(analyze_games, positions, depth, min(time_limit, max_time_limit),
+                                              executor=analysis_pool)
+    except AdmissionRejected:
+        raise HTTPException(status_code=503, detail="Batch analysis is busy, try again later")
+    return {
+        "results": [
+            {
+                "current_player": game.current_player,
+                "game_over": game.is_game_over(),
+                "best_move": result["best_move"],
+                "score": result["score"],
+                "depth": result["depth"],
+                "pv": result["pv"],
+                "truncated": result["truncated"]
+            }
+            for game, result in zip(positions, results)
+        ]
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
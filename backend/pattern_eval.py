@@ -0,0 +1,226 @@
+"""
+오델로 패턴 테이블 평가
+가장자리+2X, 모서리 3x3/2x5, 가로줄, 대각선 패턴의 칸 상태를 3진수 인덱스로 인코딩하고
+미리 계산된 가중치 테이블을 조회하여 포지션을 평가 (백돌 기준 점수)
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+from symmetry import SQUARE_MAPS
+
+# 패턴 종류별 기준 칸 목록 (8가지 대칭으로 확장됨)
+PATTERN_FAMILIES = [
+    ("edge2x", [(0, c) for c in range(8)] + [(1, 1), (1, 6)]),
+    ("corner3x3", [(r, c) for r in range(3) for c in range(3)]),
+    ("corner2x5", [(r, c) for r in range(2) for c in range(5)]),
+    ("line2", [(1, c) for c in range(8)]),
+    ("line3", [(2, c) for c in range(8)]),
+    ("line4", [(3, c) for c in range(8)]),
+    ("diag8", [(i, i) for i in range(8)]),
+    ("diag7", [(i, i + 1) for i in range(7)]),
+    ("diag6", [(i, i + 2) for i in range(6)]),
+    ("diag5", [(i, i + 3) for i in range(5)]),
+    ("diag4", [(i, i + 4) for i in range(4)]),
+]
+
+FAMILY_NAMES = [name for name, _ in PATTERN_FAMILIES]
+
+WEIGHTS_MAGIC = b"OPAT"
+WEIGHTS_VERSION = 1
+
+# 손으로 정한 가중치로 만든 초기 테이블 파일 (학습 시작점, OthelloAI가 자동으로 사용하지 않음)
+SEED_WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "pattern_weights_seed.bin")
+
+
+def _build_instances() -> List[Tuple[int, List[int]]]:
+    """패턴 종류를 8가지 대칭으로 확장 (같은 칸 집합은 한 번만), (종류 번호, 칸 번호 목록) 반환"""
+    instances = []
+    for family, (_, squares) in enumerate(PATTERN_FAMILIES):
+        seen = set()
+        for square_map in SQUARE_MAPS:
+            mapped = [square_map[r * 8 + c] for r, c in squares]
+            if frozenset(mapped) in seen:
+                continue
+            seen.add(frozenset(mapped))
+            instances.append((family, mapped))
+    return instances
+
+
+# 패턴 인스턴스: (종류 번호, 칸 번호 목록)
+INSTANCES = _build_instances()
+
+# 칸별 갱신 정보: SQUARE_UPDATES[sq] = [(인스턴스 번호, 3의 거듭제곱), ...]
+SQUARE_UPDATES: List[List[Tuple[int, int]]] = [[] for _ in range(64)]
+for _instance, (_, _squares) in enumerate(INSTANCES):
+    for _digit, _square in enumerate(_squares):
+        SQUARE_UPDATES[_square].append((_instance, 3 ** _digit))
+
+
+def compute_indices(board: List[List[int]]) -> List[int]:
+    """보드의 모든 패턴 인스턴스 인덱스 계산 (칸 값 0/1/2를 3진수 자릿수로 사용)"""
+    indices = [0] * len(INSTANCES)
+    for square in range(64):
+        cell = board[square // 8][square % 8]
+        if cell:
+            for instance, power in SQUARE_UPDATES[square]:
+                indices[instance] += cell * power
+    return indices
+
+
+def update_indices(indices: List[int], move: Tuple[int, int], player: int,
+                   flips: List[Tuple[int, int]]) -> List[int]:
+    """착수와 뒤집힌 돌을 반영한 새 인덱스 목록 반환 (원래 목록은 변경하지 않음)"""
+    updated = list(indices)
+    for instance, power in SQUARE_UPDATES[move[0] * 8 + move[1]]:
+        updated[instance] += player * power
+    # 상대 돌(3 - player)이 player로 바뀜
+    delta = 2 * player - 3
+    for row, col in flips:
+        for instance, power in SQUARE_UPDATES[row * 8 + col]:
+            updated[instance] += delta * power
+    return updated
+
+
+class PatternEvaluator:
+    """패턴 테이블 조회 기반 평가 함수"""
+
+    def __init__(self, tables: Sequence[Sequence[int]], scale: float, buffer: Optional[mmap.mmap] = None):
+        self.tables = tables
+        self.scale = scale
+        self.buffer = buffer  # 테이블이 가리키는 메모리 맵 (있으면 평가 함수와 수명을 같이함)
+        # 인스턴스별 테이블 (조회 시 종류 번호 변환을 생략)
+        self.instance_tables = [tables[family] for family, _ in INSTANCES]
+
+    def evaluate_indices(self, indices: List[int]) -> float:
+        """패턴 인덱스 목록의 평가 점수 (백돌 기준)"""
+        return sum(table[index] for table, index in zip(self.instance_tables, indices)) * self.scale
+
+    def evaluate(self, board: List[List[int]]) -> float:
+        """보드의 평가 점수 (백돌 기준)"""
+        return self.evaluate_indices(compute_indices(board))
+
+
+def save_weights(path: str, tables: List[array], scale: float):
+    """패턴 가중치 파일 저장
+
+    형식 (리틀 엔디언): magic "OPAT", uint16 버전, uint16 종류 수, float32 배율,
+    이후 종류별로 uint8 이름 길이, 이름, uint8 칸 수, int16 x 3^칸 수
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(WEIGHTS_MAGIC)
+        f.write(struct.pack("<HHf", WEIGHTS_VERSION, len(PATTERN_FAMILIES), scale))
+        for (name, squares), table in zip(PATTERN_FAMILIES, tables):
+            encoded = name.encode("ascii")
+            f.write(struct.pack("<B", len(encoded)) + encoded)
+            f.write(struct.pack("<B", len(squares)))
+            values = array("h", table)
+            if sys.byteorder != "little":
+                values.byteswap()
+            values.tofile(f)
+
+
+@lru_cache(maxsize=4)
+def load_weights(path: str) -> PatternEvaluator:
+    """패턴 가중치 파일을 읽어 평가 함수 생성 (같은 파일은 프로세스당 한 번만 읽음)
+
+    리틀 엔디언 시스템에서는 파일을 메모리 맵으로 열어 테이블을 복사 없이 참조하므로,
+    같은 파일을 여는 서버 워커와 분석 워커 프로세스가 페이지를 공유한다.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(buffer)
+    if bytes(view[:4]) != WEIGHTS_MAGIC:
+        raise ValueError(f"Not a pattern weights file: {path}")
+    version, family_count, scale = struct.unpack_from("<HHf", view, 4)
+    if version != WEIGHTS_VERSION:
+        raise ValueError(f"Unsupported pattern weights version: {version}")
+    if family_count != len(PATTERN_FAMILIES):
+        raise ValueError(f"Pattern family count mismatch: {family_count}")
+
+    tables = []
+    offset = 12
+    for name, squares in PATTERN_FAMILIES:
+        name_length = view[offset]
+        file_name = bytes(view[offset + 1:offset + 1 + name_length]).decode("ascii")
+        offset += 1 + name_length
+        size = view[offset]
+        offset += 1
+        if file_name != name or size != len(squares):
+            raise ValueError(f"Pattern family mismatch: {file_name}")
+        end = offset + 2 * 3 ** size
+        if end > len(view):
+            raise ValueError(f"Truncated pattern weights file: {path}")
+        if sys.byteorder == "little":
+            tables.append(view[offset:end].cast("h"))
+        else:
+            table = array("h", view[offset:end].tobytes())
+            table.byteswap()
+            tables.append(table)
+        offset = end
+
+    if sys.byteorder != "little":
+        # 모든 테이블을 복사했으므로 메모리 맵이 필요 없음
+        view.release()
+        buffer.close()
+        buffer = None
+    return PatternEvaluator(tables, scale, buffer)
+
+
+def default_tables(weights: Dict[str, float], scale: float = 1 / 16) -> List[array]:
+    """OthelloAI의 손으로 정한 가중치(위치, 모서리 안정성, 가득 찬 가장자리)로 초기 테이블 생성
+
+    각 칸의 가치를 그 칸을 포함하는 패턴 인스턴스 수로 나누어 분배하므로,
+    테이블 합은 기존 평가의 위치 항과 같다 (반올림 오차 제외).
+    안정성은 모서리와 한 가지 색으로 가득 찬 가장자리만 반영한다.
+    """
+    corners = {0, 7, 56, 63}
+    corner_adjacent = {1, 6, 8, 9, 14, 15, 48, 49, 54, 55, 57, 62}
+    square_values = []
+    for square in range(64):
+        row, col = square // 8, square % 8
+        value = 0.0
+        if square in corners:
+            value += weights['corner'] + weights['stability']
+        if square in corner_adjacent:
+            value += weights['corner_adjacent']
+        if row in (0, 7) or col in (0, 7):
+            value += weights['edge']
+        square_values.append(value)
+    coverage = [len(updates) for updates in SQUARE_UPDATES]
+
+    tables = []
+    for name, squares in PATTERN_FAMILIES:
+        shares = [square_values[r * 8 + c] / coverage[r * 8 + c] for r, c in squares]
+        table = array("h", [0]) * (3 ** len(squares))
+        for index in range(len(table)):
+            value = 0.0
+            digits = index
+            cells = []
+            for share in shares:
+                cell = digits % 3
+                digits //= 3
+                cells.append(cell)
+                if cell:
+                    value += share if cell == 2 else -share
+            # 한 가지 색으로 가득 찬 가장자리의 모서리 외 6칸은 안정돌
+            if name == "edge2x" and cells[0] and all(cell == cells[0] for cell in cells[:8]):
+                value += 6 * weights['stability'] * (1 if cells[0] == 2 else -1)
+            table[index] = max(-32768, min(32767, round(value / scale)))
+        tables.append(table)
+    return tables
+
+
+if __name__ == "__main__":
+    # 기존 가중치로 초기 패턴 가중치 파일 생성
+    from ai_engine import OthelloAI
+    output = sys.argv[1] if len(sys.argv) > 1 else SEED_WEIGHTS_PATH
+    scale = 1 / 16
+    save_weights(output, default_tables(OthelloAI().weights, scale), scale)
+    print(f"Pattern weights written to {output}")
@@ -0,0 +1,95 @@
+"""
+오델로 공유 탐색 캐시
+프로세스 전체에서 공유하는 크기 제한 LRU 캐시로, 8가지 대칭으로 정규화한 포지션별 탐색 결과(최선의 수, 점수, 깊이)를 저장
+서로 다른 게임이 회전/반전으로 같은 포지션에 도달하면 다시 탐색하지 않음
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
+from symmetry import canonical_key, inverse_transform_move, transform_move
+
+# 기본 최대 항목 수 (항목당 약 200바이트)
+DEFAULT_MAX_ENTRIES = int(os.environ.get("OTHELLO_SEARCH_CACHE_SIZE", "100000"))
+
+
+class SearchCache:
+    """정규화 포지션 -> (최선의 수, 점수, 깊이) LRU 캐시 (스레드 안전)
+
+    점수는 현재 차례 플레이어 기준이며, 수는 정규화 좌표로 저장하고 조회 시 원래 좌표로 되돌린다.
+    평가 함수 설정이 다르면 점수가 다르므로, 설정별 네임스페이스를 키에 포함한다.
+    시간 제한으로 중단된 탐색 결과는 일부 수만 평가한 결과일 수 있으므로 저장하지 않는다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.namespaces = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def namespace_id(self, namespace: Hashable) -> int:
+        """평가 함수 설정을 작은 정수 네임스페이스로 변환"""
+        with self.lock:
+            return self.namespaces.setdefault(namespace, len(self.namespaces))
+
+    def _key(self, namespace: int, board: List[List[int]], current_player: int) -> Tuple[Tuple[int, bytes], int]:
+        """(캐시 키, 대칭 번호)"""
+        key, symmetry = canonical_key(board, current_player)
+        return (namespace, bytes(key)), symmetry
+
+    def lookup(self, namespace: int, board: List[List[int]], current_player: int,
+               depth: int) -> Optional[Tuple[Optional[Tuple[int, int]], float, int]]:
+        """depth 이상으로 탐색한 결과가 있으면 (원래 좌표의 최선의 수, 점수, 깊이) 반환"""
+        key, symmetry = self._key(namespace, board, current_player)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[2] < depth:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        move, score, cached_depth = entry
+        return inverse_transform_move(move, symmetry), score, cached_depth
+
+    def store(self, namespace: int, board: List[List[int]], current_player: int,
+              move: Optional[Tuple[int, int]], score: float, depth: int):
+        """끝까지 탐색한 결과 저장 (같은 포지션에 같은 깊이 이상의 결과가 있으면 유지)"""
+        key, symmetry = self._key(namespace, board, current_player)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[2] >= depth:
+                self.entries.move_to_end(key)
+                return
+            self.entries[key] = (transform_move(move, symmetry), score, depth)
+            self.entries.move_to_end(key)
+            self.stores += 1
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """모든 항목과 통계 초기화"""
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.stores = 0
+
+    def stats(self) -> dict:
+        """캐시 통계 (적중률 포함)"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+# 프로세스 전체 공유 캐시 (서버의 모든 게임과 탐색 스레드, 워커 프로세스별로 하나)
+shared_search_cache = SearchCache()
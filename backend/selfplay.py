@@ -0,0 +1,209 @@
+"""
+오델로 자체 대국 토너먼트
+두 AI 설정을 프로세스 풀에서 여러 판 대국시켜 승률, 신뢰구간, 수당 노드 수와 시간을 측정
+
+사용 예:
+    python selfplay.py --games 1000 --engine-a '{"max_depth": 4}' --engine-b '{"max_depth": 3}'
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional
+from game_engine import OthelloGame
+from ai_engine import OthelloAI
+from analysis import game_from_moves
+from symmetry import canonical_key
+
+# 워커 프로세스별 AI 인스턴스 (설정 JSON -> OthelloAI)
+_engines = {}
+
+# 오프닝 수순 길이 자동 선택 범위 (7수: 대칭으로 서로 다른 오프닝 10649개, 열거에 수 초)
+DEFAULT_OPENING_PLIES = 4
+MAX_OPENING_PLIES = 7
+
+
+def opening_positions(plies: int) -> List[List[Tuple[int, int]]]:
+    """초기 포지션에서 plies 수까지의 모든 수순 중 대칭으로 서로 다른 포지션의 수순 목록"""
+    openings = []
+    seen = set()
+
+    def expand(game: OthelloGame, moves: List[Tuple[int, int]]):
+        if len(moves) == plies or game.is_game_over():
+            key, _ = canonical_key(game.board, game.current_player)
+            if key not in seen:
+                seen.add(key)
+                openings.append(list(moves))
+            return
+        for move in game.get_valid_moves():
+            child = game.copy()
+            child.make_move(move[0], move[1], record=False)
+            expand(child, moves + [move])
+
+    expand(OthelloGame(), [])
+    return openings
+
+
+def choose_openings(games: int, opening_plies: Optional[int] = None) -> List[List[Tuple[int, int]]]:
+    """games판을 서로 다른 (오프닝, 흑백) 조합으로 둘 수 있는 오프닝 목록
+
+    opening_plies가 없으면 DEFAULT_OPENING_PLIES부터 MAX_OPENING_PLIES까지 중 충분한 가장 짧은 수순을 쓴다.
+    엔진이 결정적이므로 같은 조합의 대국은 같은 결과를 반복할 뿐 독립 표본이 아니다.
+    """
+    if opening_plies is not None:
+        return opening_positions(opening_plies)
+    for plies in range(DEFAULT_OPENING_PLIES, MAX_OPENING_PLIES + 1):
+        openings = opening_positions(plies)
+        if 2 * len(openings) >= games:
+            break
+    return openings
+
+
+def _init_worker():
+    """워커 프로세스 초기화 (게임 엔진의 디버그 출력 숨김)"""
+    sys.stdout = open(os.devnull, "w")
+
+
+def _get_engine(config: dict) -> OthelloAI:
+    """설정별 AI 인스턴스 (워커 프로세스당 한 번 생성, 공유 탐색 캐시는 쓰지 않음)"""
+    key = json.dumps(config, sort_keys=True)
+    if key not in _engines:
+        _engines[key] = OthelloAI(**config)
+    return _engines[key]
+
+
+def play_game(opening: List[Tuple[int, int]], black_config: dict, white_config: dict) -> dict:
+    """한 판 대국 후 결과와 흑/백 엔진별 수 개수, 노드 수, 생각 시간 반환"""
+    game = game_from_moves(opening)
+    engines = {1: _get_engine(black_config), 2: _get_engine(white_config)}
+    stats = {player: {"moves": 0, "nodes": 0, "time": 0.0} for player in (1, 2)}
+    moves = list(opening)
+
+    while not game.is_game_over():
+        player = game.current_player
+        ai = engines[player]
+        start_time = time.time()
+        move = ai.get_best_move(game)
+        stats[player]["time"] += time.time() - start_time
+
+        if move is None:
+            game.pass_turn()
+            continue
+        stats[player]["moves"] += 1
+        stats[player]["nodes"] += ai.nodes
+        game.make_move(move[0], move[1])
+        moves.append(move)
+
+    return {
+        "moves": moves,
+        "winner": game.winner,
+        "black_count": game.get_black_count(),
+        "white_count": game.get_white_count(),
+        "black": stats[1],
+        "white": stats[2]
+    }
+
+
+def _play_pair_game(args: Tuple[List[Tuple[int, int]], dict, dict, bool]) -> dict:
+    """A/B 관점의 대국 결과 (a_is_black: 엔진 A가 흑돌인지)"""
+    opening, config_a, config_b, a_is_black = args
+    if a_is_black:
+        result = play_game(opening, config_a, config_b)
+        a_color, a_stats, b_stats = 1, result["black"], result["white"]
+    else:
+        result = play_game(opening, config_b, config_a)
+        a_color, a_stats, b_stats = 2, result["white"], result["black"]
+
+    if result["winner"] == 0:
+        score = 0.5
+    else:
+        score = 1.0 if result["winner"] == a_color else 0.0
+    return {"score": score, "a": a_stats, "b": b_stats, "moves": result["moves"], "winner": result["winner"]}
+
+
+def summarize(results: List[dict]) -> dict:
+    """대국 결과 목록을 엔진 A 기준 승률, 95% 신뢰구간, Elo 차이, 엔진별 통계로 요약"""
+    games = len(results)
+    scores = [result["score"] for result in results]
+    mean = sum(scores) / games
+    variance = sum((score - mean) ** 2 for score in scores) / max(1, games - 1)
+    margin = 1.96 * math.sqrt(variance / games)
+
+    def elo(p: float) -> float:
+        p = min(max(p, 1e-6), 1 - 1e-6)
+        return -400 * math.log10(1 / p - 1)
+
+    def engine_stats(side: str) -> dict:
+        moves = sum(result[side]["moves"] for result in results)
+        nodes = sum(result[side]["nodes"] for result in results)
+        seconds = sum(result[side]["time"] for result in results)
+        return {
+            "moves": moves,
+            "avg_nodes_per_move": nodes / moves if moves else 0.0,
+            "avg_time_per_move": seconds / moves if moves else 0.0,
+            "nodes_per_second": nodes / seconds if seconds else 0.0
+        }
+
+    return {
+        "games": games,
+        "wins": scores.count(1.0),
+        "draws": scores.count(0.5),
+        "losses": scores.count(0.0),
+        "score": mean,
+        "confidence_interval": [max(0.0, mean - margin), min(1.0, mean + margin)],
+        "elo_diff": elo(mean),
+        "elo_interval": [elo(mean - margin), elo(mean + margin)],
+        "engine_a": engine_stats("a"),
+        "engine_b": engine_stats("b")
+    }
+
+
+def run_match(config_a: dict, config_b: dict, games: int = 100, opening_plies: Optional[int] = None,
+              max_workers: Optional[int] = None, record_path: Optional[str] = None) -> dict:
+    """엔진 A와 B의 대국 (각 오프닝을 흑백을 바꿔 두 번씩 두어 선후 유불리를 상쇄)
+
+    서로 다른 (오프닝, 흑백) 조합보다 많은 대국은 같은 대국의 반복이므로 조합 수로 줄인다.
+    record_path가 주어지면 각 대국의 수순과 승자를 JSON lines로 기록한다 (가중치 튜닝용).
+    """
+    openings = choose_openings(games, opening_plies)
+    if games > 2 * len(openings):
+        warnings.warn(f"Only {2 * len(openings)} distinct games with {len(openings)} openings; "
+                      f"playing {2 * len(openings)} instead of {games} (use more opening plies)")
+        games = 2 * len(openings)
+    tasks = []
+    for index in range(games):
+        opening = openings[(index // 2) % len(openings)]
+        tasks.append((opening, config_a, config_b, index % 2 == 0))
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        results = list(executor.map(_play_pair_game, tasks, chunksize=max(1, games // 64)))
+
+    if record_path is not None:
+        with open(record_path, "a") as f:
+            for result in results:
+                f.write(json.dumps({"moves": result["moves"], "winner": result["winner"]}) + "\n")
+
+    summary = summarize(results)
+    summary["openings"] = len(openings)
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오델로 AI 자체 대국 토너먼트")
+    parser.add_argument("--games", type=int, default=100, help="대국 수 (짝수 권장)")
+    parser.add_argument("--engine-a", default="{}", help="엔진 A의 OthelloAI 설정 (JSON)")
+    parser.add_argument("--engine-b", default="{}", help="엔진 B의 OthelloAI 설정 (JSON)")
+    parser.add_argument("--opening-plies", type=int, default=None,
+                        help="오프닝 수순 길이 (기본: 대국 수에 맞춰 4-7수 중 선택)")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수")
+    parser.add_argument("--record", default=None, help="대국 기록을 추가할 JSON lines 파일")
+    args = parser.parse_args()
+
+    summary = run_match(json.loads(args.engine_a), json.loads(args.engine_b),
+                        args.games, args.opening_plies, args.workers, args.record)
+    print(json.dumps(summary, indent=2))
@@ -0,0 +1,126 @@
+"""
+오델로 비트보드 안정돌 계산
+64비트 정수 비트보드(비트 i = row * 8 + col)로 다시는 뒤집힐 수 없는 돌을 계산
+(종료 판정용 착수 가능 칸 계산도 제공)
+
+한 돌은 가로, 세로, 두 대각선의 네 축 각각에서 다음 중 하나를 만족하면 안정돌이다.
+- 그 축의 줄이 가득 차 있음
+- 그 축 방향으로 보드 가장자리에 닿아 있음
+- 그 축 방향으로 이웃한 같은 색 안정돌이 있음
+"""
+
+from typing import List, Tuple
+
+FULL = 0xFFFFFFFFFFFFFFFF
+FILE_A = 0x0101010101010101  # col 0
+FILE_H = 0x8080808080808080  # col 7
+RANK_1 = 0x00000000000000FF  # row 0
+RANK_8 = 0xFF00000000000000  # row 7
+BORDER = FILE_A | FILE_H | RANK_1 | RANK_8
+CORNERS = 0x8100000000000081
+
+
+def _line_masks(dr: int, dc: int) -> List[int]:
+    """(dr, dc) 방향의 모든 줄 마스크 목록"""
+    masks = []
+    for start in range(64):
+        row, col = start // 8, start % 8
+        # 줄의 시작 칸 (반대 방향으로 더 갈 수 없는 칸)만 사용
+        if 0 <= row - dr < 8 and 0 <= col - dc < 8:
+            continue
+        mask = 0
+        while 0 <= row < 8 and 0 <= col < 8:
+            mask |= 1 << (row * 8 + col)
+            row, col = row + dr, col + dc
+        masks.append(mask)
+    return masks
+
+
+HORIZONTAL_LINES = _line_masks(0, 1)
+VERTICAL_LINES = _line_masks(1, 0)
+DIAGONAL_LINES = _line_masks(1, 1)
+ANTI_DIAGONAL_LINES = _line_masks(1, -1)
+
+
+def board_to_bitboards(board: List[List[int]]) -> Tuple[int, int]:
+    """2차원 리스트 보드를 (흑돌, 백돌) 비트보드로 변환"""
+    black = 0
+    white = 0
+    for row in range(8):
+        for col in range(8):
+            cell = board[row][col]
+            if cell == 1:
+                black |= 1 << (row * 8 + col)
+            elif cell == 2:
+                white |= 1 << (row * 8 + col)
+    return black, white
+
+
+# 8방향 이동: (왼쪽 시프트 양, 도착 칸 마스크), 음수는 오른쪽 시프트 (가로로 줄을 넘어가는 비트 제거)
+_MOVE_SHIFTS = [
+    (1, FULL & ~FILE_A), (-1, FULL & ~FILE_H),   # 오른쪽, 왼쪽
+    (8, FULL), (-8, FULL),                        # 아래, 위
+    (9, FULL & ~FILE_A), (7, FULL & ~FILE_H),    # 오른쪽 아래, 왼쪽 아래
+    (-7, FULL & ~FILE_A), (-9, FULL & ~FILE_H),  # 오른쪽 위, 왼쪽 위
+]
+
+
+def legal_moves(own: int, opponent: int) -> int:
+    """own 차례에서 착수 가능한 칸의 비트보드"""
+    empty = FULL & ~(own | opponent)
+    moves = 0
+    for shift, mask in _MOVE_SHIFTS:
+        if shift > 0:
+            run = (own << shift) & mask & opponent
+            for _ in range(5):
+                run |= (run << shift) & mask & opponent
+            moves |= (run << shift) & mask & empty
+        else:
+            run = (own >> -shift) & mask & opponent
+            for _ in range(5):
+                run |= (run >> -shift) & mask & opponent
+            moves |= (run >> -shift) & mask & empty
+    return moves
+
+
+def _full_lines(occupied: int, lines: List[int]) -> int:
+    """가득 찬 줄들의 합집합 마스크"""
+    full = 0
+    for mask in lines:
+        if occupied & mask == mask:
+            full |= mask
+    return full
+
+
+def _stable_for(own: int, full_h: int, full_v: int, full_d: int, full_a: int) -> int:
+    """한쪽 색의 안정돌 마스크 (안정돌 집합이 더 커지지 않을 때까지 반복)"""
+    stable = 0
+    while True:
+        # 각 축에서 양쪽 이웃 중 하나가 안정돌인 칸
+        horizontal = full_h | FILE_A | FILE_H | ((stable << 1) & ~FILE_A) | ((stable >> 1) & ~FILE_H)
+        vertical = full_v | RANK_1 | RANK_8 | (stable << 8) | (stable >> 8)
+        diagonal = full_d | BORDER | ((stable << 9) & ~FILE_A) | ((stable >> 9) & ~FILE_H)
+        anti_diagonal = full_a | BORDER | ((stable << 7) & ~FILE_H) | ((stable >> 7) & ~FILE_A)
+        new_stable = own & horizontal & vertical & diagonal & anti_diagonal & FULL
+        if new_stable == stable:
+            return stable
+        stable = new_stable
+
+
+def stable_discs(black: int, white: int) -> Tuple[int, int]:
+    """(흑돌 안정돌, 백돌 안정돌) 마스크 반환"""
+    occupied = black | white
+    full_h = _full_lines(occupied, HORIZONTAL_LINES)
+    full_v = _full_lines(occupied, VERTICAL_LINES)
+    full_d = _full_lines(occupied, DIAGONAL_LINES)
+    full_a = _full_lines(occupied, ANTI_DIAGONAL_LINES)
+    return (
+        _stable_for(black, full_h, full_v, full_d, full_a),
+        _stable_for(white, full_h, full_v, full_d, full_a)
+    )
+
+
+def count_stable(board: List[List[int]]) -> Tuple[int, int]:
+    """(흑돌 안정돌 개수, 백돌 안정돌 개수) 반환"""
+    black_stable, white_stable = stable_discs(*board_to_bitboards(board))
+    return bin(black_stable).count("1"), bin(white_stable).count("1")
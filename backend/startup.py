@@ -0,0 +1,80 @@
+"""
+서버 시작 단계
+미리 계산된 테이블(메모리 맵 패턴 가중치, 튜닝된 평가 가중치)을 프로세스에 올리고,
+선택적으로 예열 탐색을 수행하여 첫 AI 착수 요청이 정상 상태와 같은 속도로 처리되게 한 뒤 준비 완료를 알림
+"""
+
+import os
+import time
+from typing import Optional
+from game_engine import OthelloGame
+from ai_engine import DEFAULT_EVAL_WEIGHTS_PATH, PATTERN_WEIGHTS_PATH, OthelloAI, load_eval_weights
+from pattern_eval import load_weights
+from transcript import text_to_moves
+
+# 예열 탐색 포지션 (표준 오프닝 이후 중반 진입 포지션, 탐색 경로 대부분을 거침)
+WARMUP_TRANSCRIPT = "f5d6c3d3c4f4f6f3e6e7"
+
+
+class EngineStartup:
+    """시작 단계 상태와 소요 시간 (starting -> ready)"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.ready_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.tables = {}
+        self.tables_seconds = 0.0
+        self.warmup_seconds = 0.0
+        self.warmup_nodes = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.ready_at is not None
+
+    def load_tables(self):
+        """가중치 파일을 읽어 프로세스 캐시에 올림 (이후 OthelloAI 생성 시 파일을 다시 읽지 않음)"""
+        start_time = time.time()
+        if PATTERN_WEIGHTS_PATH is not None:
+            evaluator = load_weights(PATTERN_WEIGHTS_PATH)
+            self.tables["pattern_weights"] = {
+                "path": PATTERN_WEIGHTS_PATH,
+                "entries": sum(len(table) for table in evaluator.tables),
+                "memory_mapped": evaluator.buffer is not None
+            }
+        if os.path.exists(DEFAULT_EVAL_WEIGHTS_PATH):
+            load_eval_weights(DEFAULT_EVAL_WEIGHTS_PATH)
+            self.tables["eval_weights"] = {"path": DEFAULT_EVAL_WEIGHTS_PATH}
+        self.tables_seconds = time.time() - start_time
+
+    def warm_up(self, depth: int, time_limit: float):
+        """예열 포지션에서 AI 착수와 같은 경로로 탐색 (결과는 버림)"""
+        start_time = time.time()
+        game = OthelloGame.from_moves(text_to_moves(WARMUP_TRANSCRIPT), mode="human_vs_ai")
+        ai = OthelloAI(max_depth=depth, time_limit=time_limit)
+        ai.get_best_move(game)
+        self.warmup_nodes = ai.nodes
+        self.warmup_seconds = time.time() - start_time
+
+    def run(self, warmup_depth: int = 0, warmup_time_limit: float = 2.0):
+        """시작 단계 실행 (warmup_depth가 0이면 예열 탐색 생략, 실패하면 error에 기록 후 다시 발생)"""
+        try:
+            self.load_tables()
+            if warmup_depth > 0:
+                self.warm_up(warmup_depth, warmup_time_limit)
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            raise
+        self.ready_at = time.time()
+
+    def stats(self) -> dict:
+        """시작 단계 상태와 소요 시간"""
+        return {
+            "ready": self.ready,
+            "error": self.error,
+            "startup_seconds": (self.ready_at or time.time()) - self.started_at,
+            "tables": self.tables,
+            "tables_seconds": self.tables_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "warmup_nodes": self.warmup_nodes
+        }
@@ -0,0 +1,77 @@
+"""
+오델로 보드 대칭 변환
+정사각형 보드의 8가지 대칭(회전 4 x 반전 2)과 정규화된 포지션 키를 제공
+"""
+
+from typing import List, Tuple, Optional
+
+# 각 대칭 변환: (row, col) -> (row', col')
+_TRANSFORMS = [
+    lambda r, c: (r, c),          # 항등
+    lambda r, c: (c, 7 - r),      # 90도 회전
+    lambda r, c: (7 - r, 7 - c),  # 180도 회전
+    lambda r, c: (7 - c, r),      # 270도 회전
+    lambda r, c: (r, 7 - c),      # 좌우 반전
+    lambda r, c: (7 - r, c),      # 상하 반전
+    lambda r, c: (c, r),          # 주대각선 반전
+    lambda r, c: (7 - c, 7 - r),  # 부대각선 반전
+]
+
+SYMMETRY_COUNT = len(_TRANSFORMS)
+
+# SQUARE_MAPS[s][i]: 원래 칸 i가 대칭 s에서 이동하는 칸 (i = row * 8 + col)
+SQUARE_MAPS = [
+    [transform(i // 8, i % 8)[0] * 8 + transform(i // 8, i % 8)[1] for i in range(64)]
+    for transform in _TRANSFORMS
+]
+
+# INVERSE_MAPS[s][j]: 대칭 s에서 칸 j로 이동해 온 원래 칸
+INVERSE_MAPS = []
+for _square_map in SQUARE_MAPS:
+    _inverse = [0] * 64
+    for _i, _j in enumerate(_square_map):
+        _inverse[_j] = _i
+    INVERSE_MAPS.append(_inverse)
+
+
+def transform_board(board: List[List[int]], symmetry: int) -> Tuple[int, ...]:
+    """보드를 대칭 변환하여 길이 64의 튜플로 반환"""
+    cells = [0] * 64
+    square_map = SQUARE_MAPS[symmetry]
+    for i in range(64):
+        cells[square_map[i]] = board[i // 8][i % 8]
+    return tuple(cells)
+
+
+def canonical_key(board: List[List[int]], current_player: int) -> Tuple[Tuple[int, ...], int]:
+    """8가지 대칭 중 사전순으로 가장 작은 포지션 키와 그 대칭 번호 반환"""
+    best_cells = None
+    best_symmetry = 0
+    for symmetry in range(SYMMETRY_COUNT):
+        cells = transform_board(board, symmetry)
+        if best_cells is None or cells < best_cells:
+            best_cells = cells
+            best_symmetry = symmetry
+    return best_cells + (current_player,), best_symmetry
+
+
+def transform_move(move: Optional[Tuple[int, int]], symmetry: int) -> Optional[Tuple[int, int]]:
+    """원래 좌표의 수를 대칭 좌표로 변환"""
+    if move is None:
+        return None
+    square = SQUARE_MAPS[symmetry][move[0] * 8 + move[1]]
+    return (square // 8, square % 8)
+
+
+def inverse_transform_move(move: Optional[Tuple[int, int]], symmetry: int) -> Optional[Tuple[int, int]]:
+    """대칭 좌표의 수를 원래 좌표로 되돌림"""
+    if move is None:
+        return None
+    square = INVERSE_MAPS[symmetry][move[0] * 8 + move[1]]
+    return (square // 8, square % 8)
+
+
+def key_to_board(key: Tuple[int, ...]) -> Tuple[List[List[int]], int]:
+    """정규화된 포지션 키를 보드와 차례로 복원"""
+    board = [list(key[row * 8:row * 8 + 8]) for row in range(8)]
+    return board, key[64]
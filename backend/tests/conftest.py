@@ -0,0 +1,36 @@
+"""
+테스트 공통 설정
+backend 모듈을 직접 import하고, 무작위 대국에서 나온 포지션을 여러 테스트가 함께 사용
+"""
+
+import os
+import random
+import sys
+from typing import List
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_engine import OthelloGame  # noqa: E402
+
+
+def random_playout(rng: random.Random) -> List[OthelloGame]:
+    """초기 포지션부터 무작위 합법 수로 끝까지 둔 대국의 모든 포지션 (종료 포지션 포함)"""
+    game = OthelloGame(mode="human_vs_human")
+    positions = [game.copy()]
+    while not game.is_game_over():
+        valid_moves = game.get_valid_moves()
+        if valid_moves:
+            game.make_move(*rng.choice(valid_moves), record=False)
+        else:
+            game.pass_turn(record=False)
+        positions.append(game.copy())
+    return positions
+
+
+@pytest.fixture(scope="session")
+def positions() -> List[OthelloGame]:
+    """무작위 대국 150판의 포지션 (약 9천 개, 고정 시드)"""
+    rng = random.Random(2024)
+    return [position for _ in range(150) for position in random_playout(rng)]
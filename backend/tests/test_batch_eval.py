@@ -0,0 +1,28 @@
+"""batch_eval.evaluate_boards가 OthelloAI._evaluate_position과 같은 점수를 내는지 확인"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import ai_engine  # noqa: E402
+from ai_engine import OthelloAI  # noqa: E402
+from batch_eval import boards_to_array, evaluate_boards  # noqa: E402
+
+
+def test_evaluate_boards_matches_scalar_evaluation(positions, monkeypatch):
+    monkeypatch.setattr(ai_engine, "PATTERN_WEIGHTS_PATH", None)
+    ai = OthelloAI()
+    expected = [ai._evaluate_position(game.copy()) for game in positions]
+    scores = evaluate_boards(boards_to_array([game.board for game in positions]), ai.weights)
+    mismatches = [index for index, (score, value) in enumerate(zip(scores, expected))
+                  if score != pytest.approx(value)]
+    assert not mismatches, f"{len(mismatches)} of {len(positions)} positions differ, first at {mismatches[0]}"
+
+
+def test_evaluate_boards_uses_given_weights(positions, monkeypatch):
+    monkeypatch.setattr(ai_engine, "PATTERN_WEIGHTS_PATH", None)
+    weights = dict(OthelloAI().weights, corner=0, mobility=100)
+    ai = OthelloAI(weights=weights)
+    sample = positions[::50]
+    scores = evaluate_boards(boards_to_array([game.board for game in sample]), weights)
+    assert list(scores) == pytest.approx([ai._evaluate_position(game.copy()) for game in sample])
@@ -0,0 +1,53 @@
+"""패턴 인덱스 점진적 갱신과 패턴 평가 마지막 수 경로가 전체 계산과 일치하는지 확인"""
+
+import pytest
+
+from ai_engine import OthelloAI
+from pattern_eval import compute_indices, default_tables, load_weights, save_weights, update_indices
+
+
+@pytest.fixture(scope="module")
+def weights_path(tmp_path_factory):
+    """기존 가중치로 만든 패턴 가중치 파일"""
+    path = str(tmp_path_factory.mktemp("patterns") / "pattern_weights.bin")
+    scale = 1 / 16
+    save_weights(path, default_tables(OthelloAI().weights, scale), scale)
+    return path
+
+
+def test_update_indices_matches_full_recompute(positions):
+    checked = 0
+    for game in positions[::2]:
+        indices = compute_indices(game.board)
+        for row, col in game.get_valid_moves():
+            flips = game.get_flips(row, col)
+            child = game.copy()
+            child.make_move(row, col, record=False)
+            assert update_indices(indices, (row, col), game.current_player, flips) == compute_indices(child.board)
+            checked += 1
+    assert checked > 5000
+
+
+def test_saved_weights_round_trip(weights_path):
+    evaluator = load_weights(weights_path)
+    tables = default_tables(OthelloAI().weights, evaluator.scale)
+    assert [list(table) for table in evaluator.tables] == [list(table) for table in tables]
+
+
+def test_children_patterns_match_position_evaluation(positions, weights_path):
+    ai = OthelloAI(pattern_weights=weights_path)
+    checked = 0
+    for game in positions[::3]:
+        moves = game.get_valid_moves()
+        if game.is_game_over() or not moves:
+            continue
+        children = []
+        for row, col in moves:
+            child = game.copy()
+            child.make_move(row, col, record=False)
+            children.append(ai._evaluate_position(child))
+        for maximizing in (True, False):
+            expected = max(children) if maximizing else min(children)
+            assert ai._evaluate_children_patterns(game, moves, maximizing) == pytest.approx(expected)
+        checked += 1
+    assert checked > 2000
@@ -0,0 +1,42 @@
+"""비트보드 합법 수와 안정돌 계산이 게임 엔진과 일치하는지 확인"""
+
+import random
+
+from stability import board_to_bitboards, count_stable, legal_moves, stable_discs
+
+
+def _squares(mask: int):
+    """비트보드를 (row, col) 목록으로 변환"""
+    return sorted((square // 8, square % 8) for square in range(64) if mask >> square & 1)
+
+
+def test_legal_moves_matches_get_valid_moves(positions):
+    for game in positions:
+        black, white = board_to_bitboards(game.board)
+        for player, own, opponent in ((1, black, white), (2, white, black)):
+            side = game.copy()
+            side.current_player = player
+            assert _squares(legal_moves(own, opponent)) == sorted(side.get_valid_moves())
+
+
+def test_stable_discs_never_flip(positions):
+    rng = random.Random(7)
+    continuations = 0
+    for game in positions[::10]:
+        black_stable, white_stable = stable_discs(*board_to_bitboards(game.board))
+        if not black_stable | white_stable:
+            continue
+        assert count_stable(game.board) == (bin(black_stable).count("1"), bin(white_stable).count("1"))
+        for _ in range(4):
+            continuation = game.copy()
+            while not continuation.is_game_over():
+                valid_moves = continuation.get_valid_moves()
+                if valid_moves:
+                    continuation.make_move(*rng.choice(valid_moves), record=False)
+                else:
+                    continuation.pass_turn(record=False)
+                black, white = board_to_bitboards(continuation.board)
+                assert black_stable & black == black_stable
+                assert white_stable & white == white_stable
+            continuations += 1
+    assert continuations > 1000
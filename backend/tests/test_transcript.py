@@ -0,0 +1,74 @@
+"""기보 변환과 빠른 재생(OthelloGame.from_moves)이 한 수씩 둔 대국과 일치하는지 확인"""
+
+import random
+from typing import List, Tuple
+
+import pytest
+
+from game_engine import OthelloGame
+from transcript import bytes_to_moves, moves_to_bytes, moves_to_text, text_to_moves
+
+
+def _play(rng: random.Random) -> Tuple[OthelloGame, List[Tuple[int, int]], int]:
+    """무작위 대국을 한 수씩 두어 (끝난 게임, 둔 수 목록, 패스 수) 반환"""
+    game = OthelloGame(mode="human_vs_human")
+    moves = []
+    passes = 0
+    while not game.is_game_over():
+        valid_moves = game.get_valid_moves()
+        if valid_moves:
+            move = rng.choice(valid_moves)
+            player = game.current_player
+            game.make_move(*move, record=False)
+            moves.append(move)
+            # 상대가 둘 곳이 없으면 착수 후 자동으로 패스됨
+            passes += int(not game.is_game_over() and game.current_player == player)
+        else:
+            game.pass_turn(record=False)
+            passes += 1
+    return game, moves, passes
+
+
+def test_replay_matches_move_by_move_game():
+    rng = random.Random(33)
+    total_passes = 0
+    for _ in range(200):
+        game, moves, passes = _play(rng)
+        total_passes += passes
+        assert text_to_moves(moves_to_text(moves)) == moves
+        assert bytes_to_moves(moves_to_bytes(moves)) == moves
+
+        replayed = OthelloGame.from_moves(text_to_moves(moves_to_text(moves)))
+        assert replayed.board == game.board
+        assert replayed.current_player == game.current_player
+        assert replayed.is_game_over() and replayed.winner == game.winner
+        assert replayed.get_moves() == moves
+    # 자동 패스 처리도 확인되었는지
+    assert total_passes > 0
+
+
+def test_replay_prefix_continues_recording():
+    rng = random.Random(34)
+    _, moves, _ = _play(rng)
+    game = OthelloGame.from_moves(moves[:20])
+    for move in moves[20:30]:
+        assert game.make_move(*move)
+    assert game.get_moves() == moves[:30]
+
+
+def test_text_is_case_and_whitespace_insensitive():
+    assert text_to_moves("F5 d6\nC3") == [(4, 5), (5, 3), (2, 2)]
+    assert moves_to_text([(4, 5), (5, 3), (2, 2)]) == "f5d6c3"
+
+
+@pytest.mark.parametrize("text", ["f5d", "f5z9", "i1", "a0"])
+def test_invalid_text_raises(text):
+    with pytest.raises(ValueError):
+        text_to_moves(text)
+
+
+def test_invalid_packed_and_illegal_moves_raise():
+    with pytest.raises(ValueError):
+        bytes_to_moves(bytes([37, 64]))
+    with pytest.raises(ValueError):
+        OthelloGame.from_moves(text_to_moves("f5f5"))
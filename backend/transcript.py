@@ -0,0 +1,50 @@
+"""
+오델로 기보 변환
+표준 문자 기보("f5d6c3...", 열 a-h + 행 1-8)와 수당 1바이트(칸 번호 row * 8 + col) 이진 기보를 지원
+패스는 기록하지 않는다 (둘 곳이 없으면 재생 시 자동으로 패스)
+"""
+
+import re
+from typing import List, Tuple
+
+COLUMNS = "abcdefgh"
+
+_MOVE_PATTERN = re.compile(r"([a-h])([1-8])")
+
+
+def move_to_text(move: Tuple[int, int]) -> str:
+    """(row, col)을 기보 표기("f5")로 변환"""
+    row, col = move
+    return f"{COLUMNS[col]}{row + 1}"
+
+
+def moves_to_text(moves: List[Tuple[int, int]]) -> str:
+    """수 목록을 문자 기보로 변환"""
+    return "".join(move_to_text(move) for move in moves)
+
+
+def text_to_moves(text: str) -> List[Tuple[int, int]]:
+    """문자 기보를 수 목록으로 변환 (대소문자와 공백 무시)"""
+    compact = re.sub(r"\s+", "", text.lower())
+    if len(compact) % 2 != 0:
+        raise ValueError("Invalid transcript length")
+
+    moves = []
+    for index in range(0, len(compact), 2):
+        match = _MOVE_PATTERN.fullmatch(compact[index:index + 2])
+        if match is None:
+            raise ValueError(f"Invalid move in transcript: {compact[index:index + 2]!r}")
+        moves.append((int(match.group(2)) - 1, COLUMNS.index(match.group(1))))
+    return moves
+
+
+def moves_to_bytes(moves: List[Tuple[int, int]]) -> bytes:
+    """수 목록을 이진 기보(수당 1바이트)로 변환"""
+    return bytes(row * 8 + col for row, col in moves)
+
+
+def bytes_to_moves(data: bytes) -> List[Tuple[int, int]]:
+    """이진 기보를 수 목록으로 변환"""
+    if any(square > 63 for square in data):
+        raise ValueError("Invalid packed transcript")
+    return [(square // 8, square % 8) for square in data]
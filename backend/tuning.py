@@ -0,0 +1,144 @@
+"""
+오델로 평가 함수 가중치 튜닝 (Texel 방식)
+기록된 대국의 포지션을 스트리밍으로 읽어, 평가 점수의 시그모이드가 대국 결과를 예측하도록
+NumPy 미니배치 경사 하강법(Adam)으로 OthelloAI.weights를 맞춤
+
+대국 기록 형식 (JSON lines): {"moves": [[row, col], ...], "winner": 1 | 2 | 0}
+(winner가 없으면 수순을 끝까지 재생한 결과를 사용, selfplay.py --record로 생성 가능)
+
+사용 예:
+    python tuning.py games.jsonl --epochs 5
+"""
+
+import argparse
+import json
+import os
+from typing import Iterator, List, Tuple, Optional
+import numpy as np
+from game_engine import OthelloGame
+from ai_engine import DEFAULT_EVAL_WEIGHTS_PATH, OthelloAI
+from batch_eval import FEATURE_NAMES, boards_to_array, feature_matrix, weight_vector
+
+# 결과와 상관이 낮은 초반 포지션은 제외
+MIN_DISCS = 12
+
+
+def iter_game_records(path: str) -> Iterator[dict]:
+    """대국 기록 파일에서 한 줄씩 대국 읽기"""
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def iter_positions(records: Iterator[dict]) -> Iterator[Tuple[List[List[int]], float]]:
+    """대국을 재생하며 (보드, 백돌 기준 결과) 생성 (결과: 백돌 승 1, 무승부 0.5, 흑돌 승 0)"""
+    for record in records:
+        game = OthelloGame()
+        boards = []
+        for row, col in record["moves"]:
+            if game.is_game_over() or not game.make_move(row, col, record=False):
+                break
+            if not game.is_game_over() and game.get_black_count() + game.get_white_count() >= MIN_DISCS:
+                boards.append([list(r) for r in game.board])
+
+        winner = record.get("winner")
+        if winner is None:
+            if not game.is_game_over():
+                continue  # 끝나지 않은 대국은 결과를 알 수 없음
+            winner = game.winner
+        outcome = {2: 1.0, 1: 0.0, 0: 0.5}[winner]
+
+        for board in boards:
+            yield board, outcome
+
+
+def iter_batches(path: str, batch_size: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """(특징 배열, 결과 배열) 미니배치 생성 (메모리에는 한 배치만 유지)"""
+    boards = []
+    outcomes = []
+    for board, outcome in iter_positions(iter_game_records(path)):
+        boards.append(board)
+        outcomes.append(outcome)
+        if len(boards) == batch_size:
+            yield feature_matrix(boards_to_array(boards))[0], np.array(outcomes)
+            boards, outcomes = [], []
+    if boards:
+        yield feature_matrix(boards_to_array(boards))[0], np.array(outcomes)
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    """오버플로 없는 시그모이드"""
+    return 1.0 / (1.0 + np.exp(-np.clip(x, -50, 50)))
+
+
+def tune(path: str, initial_weights: dict, epochs: int = 5, batch_size: int = 4096,
+         learning_rate: float = 1.0, scale: float = 400.0,
+         fixed: Optional[List[str]] = None) -> Tuple[dict, float]:
+    """가중치 튜닝, (튜닝된 가중치, 마지막 에포크 평균 손실) 반환
+
+    예측 승률 = sigmoid(평가 점수 / scale), 손실 = (예측 승률 - 결과)^2
+    fixed에 포함된 가중치는 바꾸지 않는다.
+    """
+    weights = weight_vector(initial_weights)
+    trainable = np.array([name not in (fixed or []) for name in FEATURE_NAMES])
+
+    # Adam 상태
+    m = np.zeros_like(weights)
+    v = np.zeros_like(weights)
+    beta1, beta2, epsilon = 0.9, 0.999, 1e-8
+    step = 0
+    loss = 0.0
+
+    for epoch in range(epochs):
+        total_loss = 0.0
+        total_positions = 0
+        for features, outcomes in iter_batches(path, batch_size):
+            predicted = _sigmoid(features @ weights / scale)
+            error = predicted - outcomes
+            total_loss += float((error ** 2).sum())
+            total_positions += len(outcomes)
+
+            gradient = features.T @ (2 * error * predicted * (1 - predicted)) / (scale * len(outcomes))
+            gradient *= trainable
+
+            step += 1
+            m = beta1 * m + (1 - beta1) * gradient
+            v = beta2 * v + (1 - beta2) * gradient ** 2
+            m_hat = m / (1 - beta1 ** step)
+            v_hat = v / (1 - beta2 ** step)
+            weights -= learning_rate * m_hat / (np.sqrt(v_hat) + epsilon)
+
+        if total_positions == 0:
+            raise ValueError(f"No positions found in {path}")
+        loss = total_loss / total_positions
+        print(f"epoch {epoch + 1}/{epochs}: loss {loss:.6f} ({total_positions} positions)")
+
+    return {name: float(value) for name, value in zip(FEATURE_NAMES, weights)}, loss
+
+
+def save_eval_weights(path: str, weights: dict, **metadata):
+    """OthelloAI가 읽는 가중치 파일 저장"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"weights": weights, **metadata}, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오델로 평가 함수 가중치 튜닝")
+    parser.add_argument("games", help="대국 기록 파일 (JSON lines)")
+    parser.add_argument("--output", default=DEFAULT_EVAL_WEIGHTS_PATH, help="가중치 파일 경로")
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=4096)
+    parser.add_argument("--learning-rate", type=float, default=1.0)
+    parser.add_argument("--scale", type=float, default=400.0, help="평가 점수를 승률로 바꿀 때의 배율")
+    parser.add_argument("--fixed", nargs="*", default=[], help="고정할 가중치 이름")
+    args = parser.parse_args()
+
+    # 기존 튜닝 결과가 있으면 그 값에서 시작
+    initial = OthelloAI().weights
+    tuned, final_loss = tune(args.games, initial, args.epochs, args.batch_size,
+                             args.learning_rate, args.scale, args.fixed)
+    save_eval_weights(args.output, tuned, loss=final_loss, source=args.games, scale=args.scale)
+    print(f"Weights written to {args.output}")